@@ -0,0 +1,43 @@
+"""
+Search and optimization algorithms from the AI practicals
+
+Graph search (BFS, DFS, IDDFS, A*, IDA*, ALT landmarks), minimax with
+alpha-beta, and TSP heuristics (hill climbing, genetic algorithm).
+
+Importing the package is cheap: submodules (and NumPy, which they use)
+are only loaded the first time they are accessed, e.g.
+
+    import ai_practicals
+    ai_practicals.tsp_genetic.genetic_algorithm(...)
+
+The examples run from the command line: `ai-practicals <demo>`.
+"""
+import importlib
+
+__version__ = "0.1.0"
+
+SUBMODULES = (
+    "a_star",
+    "bfs",
+    "dfs",
+    "distance_providers",
+    "graph",
+    "idda_star",
+    "iddfs",
+    "landmarks",
+    "min_max",
+    "steepest_hill",
+    "streaming",
+    "tsp_genetic",
+)
+
+__all__ = list(SUBMODULES)
+
+def __getattr__(name):
+    # Called only for names not set yet: load the submodule on first access
+    if name in SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
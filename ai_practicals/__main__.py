@@ -0,0 +1,5 @@
+from .cli import main
+
+# Guarded so worker processes started with "spawn" don't rerun the demo
+if __name__ == "__main__":
+    main()
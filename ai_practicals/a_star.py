@@ -0,0 +1,257 @@
+import heapq
+import math
+
+from .graph import as_graph
+
+def a_star_search_with_stats(graph, start_node, goal_node, heuristic_costs):
+    """
+    A* Search that keeps parent pointers instead of a path per heap entry
+
+    Each heap entry is just (f_cost, node, g_cost). A node is only pushed when
+    its g-cost improves on the best one seen so far, entries that were
+    superseded by a cheaper push are skipped when popped, and the path is
+    rebuilt once from the parent table when the goal is reached.
+
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: List of heuristic costs from each node to goal
+
+    Returns:
+        path: List of node indices representing the optimal path (None if unreachable)
+        total_cost: Total cost of the path
+        stats: Dictionary with "expanded" (nodes expanded) and "peak_heap_size"
+    """
+    # Sparse view of the graph so we only look at real edges
+    graph = as_graph(graph, no_edge=float('inf'))
+
+    # Best known cost from start and predecessor on that path, per node
+    g_score = [float('inf')] * graph.num_nodes
+    parent = [-1] * graph.num_nodes
+    g_score[start_node] = 0
+
+    # Priority queue for open nodes: (f_cost, node_index, g_cost)
+    open_list = [(heuristic_costs[start_node], start_node, 0)]
+    peak_heap_size = 1
+    expanded = 0
+
+    while open_list:
+        # Get node with lowest f_cost
+        f_cost, current, g_cost = heapq.heappop(open_list)
+
+        # Skip stale entries that a cheaper path has replaced
+        if g_cost > g_score[current]:
+            continue
+
+        # If we reached the goal, walk the parent pointers back to the start
+        if current == goal_node:
+            path = [current]
+            while current != start_node:
+                current = parent[current]
+                path.append(current)
+            path.reverse()
+            return path, g_cost, {"expanded": expanded, "peak_heap_size": peak_heap_size}
+
+        expanded += 1
+
+        # Check all neighbors of current node
+        for neighbor, edge_cost in graph.edges(current):
+            new_g_cost = g_cost + edge_cost
+
+            # Only push when this is a strictly cheaper way to reach the neighbor
+            if new_g_cost >= g_score[neighbor]:
+                continue
+
+            g_score[neighbor] = new_g_cost
+            parent[neighbor] = current
+            heapq.heappush(open_list, (new_g_cost + heuristic_costs[neighbor], neighbor, new_g_cost))
+
+        peak_heap_size = max(peak_heap_size, len(open_list))
+
+    # No path found
+    return None, float('inf'), {"expanded": expanded, "peak_heap_size": peak_heap_size}
+
+def a_star_search(graph, start_node, goal_node, heuristic_costs):
+    """
+    A* Search Algorithm using adjacency matrix representation
+    
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: List of heuristic costs from each node to goal
+    
+    Returns:
+        path: List of node indices representing the optimal path
+        total_cost: Total cost of the path
+    """
+    path, total_cost, _ = a_star_search_with_stats(graph, start_node, goal_node, heuristic_costs)
+    return path, total_cost
+
+def bidirectional_a_star(graph, start_node, goal_node, heuristic_costs=None,
+                         reverse_heuristic_costs=None, reverse_graph=None):
+    """
+    Bidirectional A* that searches forward from the start and backward from the goal
+
+    Both searches use the average potential p(v) = (h_f(v) - h_b(v)) / 2, which
+    keeps the two reduced-cost searches consistent with each other so the
+    usual bidirectional Dijkstra stopping rule stays correct: stop once the
+    smallest keys of the two queues add up to the best path found so far.
+    Without heuristics this is plain bidirectional Dijkstra.
+
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: Optional consistent estimates from each node to the goal
+        reverse_heuristic_costs: Optional consistent estimates from the start to each node
+        reverse_graph: Optional precomputed graph.reverse(), to reuse across queries
+
+    Returns:
+        path: List of node indices representing the optimal path (None if unreachable)
+        total_cost: Total cost of the path
+        stats: Dictionary with "expanded" (nodes expanded) and "peak_heap_size"
+    """
+    graph = as_graph(graph, no_edge=float('inf'))
+    if reverse_graph is None:
+        reverse_graph = graph.reverse()
+
+    def potential(node):
+        to_goal = heuristic_costs[node] if heuristic_costs is not None else 0
+        from_start = reverse_heuristic_costs[node] if reverse_heuristic_costs is not None else 0
+        return (to_goal - from_start) / 2
+
+    # Index 0 is the forward search over graph, index 1 the backward search over reverse_graph
+    graphs = (graph, reverse_graph)
+    signs = (1, -1)
+    g_score = ({start_node: 0}, {goal_node: 0})
+    parent = ({start_node: -1}, {goal_node: -1})
+    open_lists = ([(potential(start_node), start_node, 0)], [(-potential(goal_node), goal_node, 0)])
+
+    # Best complete path found so far and the node where the searches met
+    best_cost = 0 if start_node == goal_node else float('inf')
+    meeting_node = start_node if start_node == goal_node else None
+    peak_heap_size = 2
+    expanded = 0
+
+    while open_lists[0] and open_lists[1]:
+        # Stopping rule: no remaining pair of entries can give a cheaper path
+        if open_lists[0][0][0] + open_lists[1][0][0] >= best_cost:
+            break
+
+        # Expand the side with the smaller queue
+        side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+        open_list, scores, other_scores = open_lists[side], g_score[side], g_score[1 - side]
+        _, current, g_cost = heapq.heappop(open_list)
+
+        # Skip stale entries that a cheaper path has replaced
+        if g_cost > scores[current]:
+            continue
+
+        expanded += 1
+
+        for neighbor, edge_cost in graphs[side].edges(current):
+            new_g_cost = g_cost + edge_cost
+            if new_g_cost >= scores.get(neighbor, float('inf')):
+                continue
+
+            # Nodes with an infinite estimate cannot be on a start-goal path
+            key = new_g_cost + signs[side] * potential(neighbor)
+            if not math.isfinite(key):
+                continue
+
+            scores[neighbor] = new_g_cost
+            parent[side][neighbor] = current
+            heapq.heappush(open_list, (key, neighbor, new_g_cost))
+
+            # The other search already reached this node: we have a complete path
+            if neighbor in other_scores and new_g_cost + other_scores[neighbor] < best_cost:
+                best_cost = new_g_cost + other_scores[neighbor]
+                meeting_node = neighbor
+
+        peak_heap_size = max(peak_heap_size, len(open_lists[0]) + len(open_lists[1]))
+
+    stats = {"expanded": expanded, "peak_heap_size": peak_heap_size}
+    if meeting_node is None:
+        return None, float('inf'), stats
+
+    # Join the forward half (start -> meeting node) and backward half (meeting node -> goal)
+    path = []
+    node = meeting_node
+    while node != -1:
+        path.append(node)
+        node = parent[0][node]
+    path.reverse()
+    node = parent[1][meeting_node]
+    while node != -1:
+        path.append(node)
+        node = parent[1][node]
+
+    return path, best_cost, stats
+
+def main():
+    """Run the A* example on the 7 node graph"""
+    # Define a simple graph with 7 nodes (0-6)
+    # Using adjacency matrix representation
+    inf = float('inf')
+    graph = [
+        #0    1    2    3    4    5    6
+        [0,   2,   4,   inf, inf, inf, inf], # 0
+        [2,   0,   1,   7,   inf, inf, inf], # 1
+        [4,   1,   0,   inf, 3,   inf, inf], # 2
+        [inf, 7,   inf, 0,   2,   1,   inf], # 3
+        [inf, inf, 3,   2,   0,   5,   2],   # 4
+        [inf, inf, inf, 1,   5,   0,   3],   # 5
+        [inf, inf, inf, inf, 2,   3,   0]    # 6
+    ]
+    
+    # Heuristic costs to goal node (node 6)
+    # These are estimated costs from each node to the goal
+    heuristic_costs = [
+        7,  # node 0 -> goal
+        6,  # node 1 -> goal
+        5,  # node 2 -> goal
+        3,  # node 3 -> goal
+        2,  # node 4 -> goal
+        1,  # node 5 -> goal
+        0   # node 6 -> goal (goal itself)
+    ]
+    
+    # Find path from node 0 to node 6
+    start_node = 0
+    goal_node = 6
+    
+    path, cost = a_star_search(graph, start_node, goal_node, heuristic_costs)
+    
+    print("A* Search Results:")
+    if path:
+        print(f"Path found: {' -> '.join(str(node) for node in path)}")
+        print(f"Total cost: {cost}")
+        
+        # Print each step of the path with its cost
+        print("\nDetailed path:")
+        for i in range(len(path)-1):
+            current = path[i]
+            next_node = path[i+1]
+            step_cost = graph[current][next_node]
+            print(f"Vertex {current} -> Vertex {next_node}: Cost = {step_cost}")
+    else:
+        print("No path found!")
+    
+    # Another example with different start node
+    start_node = 1
+    path, cost = a_star_search(graph, start_node, goal_node, heuristic_costs)
+    
+    print("\nA* Search from Vertex 1 to Vertex 6:")
+    if path:
+        print(f"Path found: {' -> '.join(str(node) for node in path)}")
+        print(f"Total cost: {cost}")
+    else:
+        print("No path found!")
+
+if __name__ == "__main__":
+    main()
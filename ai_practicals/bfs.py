@@ -0,0 +1,125 @@
+from collections import deque
+
+import numpy as np
+
+from .graph import as_graph
+
+def bfs(graph, start_vertex):
+    """
+    Breadth-First Search implementation using adjacency matrix
+    
+    Args:
+        graph: 2D adjacency matrix where graph[i][j] represents edge from i to j,
+               or a CSRGraph
+        start_vertex: Starting vertex for BFS
+    
+    Returns:
+        List containing the BFS traversal path
+    """
+    graph = as_graph(graph)
+    visited = {start_vertex}  # Vertices are marked when enqueued, so each is queued once
+    queue = deque([start_vertex])  # Use a queue for BFS
+    path = []
+    
+    while queue:
+        # Dequeue a vertex from queue and add it to the path
+        current = queue.popleft()
+        path.append(current)
+        print(f"Visiting vertex {current}")
+        
+        # Add all unvisited neighbors to queue
+        for neighbor in graph.neighbors(current):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    
+    return path
+
+def bfs_levels(graph, sources):
+    """
+    Level-synchronous BFS that expands a whole frontier per step with NumPy
+
+    Every vertex is enqueued at most once: the frontier of each level is
+    the set of unvisited neighbors of the previous level, found with array
+    operations over the CSR edge arrays instead of a per-vertex Python loop.
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        sources: Starting vertex, or a list of starting vertices (multi-source BFS)
+
+    Returns:
+        Tuple (distances, parents) of int arrays of length n.
+        distances[v] is the hop count from the nearest source (-1 if unreachable),
+        parents[v] is the predecessor of v on a shortest path (-1 for sources
+        and unreachable vertices).
+    """
+    graph = as_graph(graph)
+    n = graph.num_nodes
+
+    distances = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+
+    frontier = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    visited[frontier] = True
+    distances[frontier] = 0
+
+    level = 0
+    while frontier.size:
+        level += 1
+
+        # Gather all outgoing edge slots of the frontier in one go
+        starts = graph.indptr[frontier]
+        lengths = graph.indptr[frontier + 1] - starts
+        total = lengths.sum()
+        if total == 0:
+            break
+        offsets = np.cumsum(lengths) - lengths
+        edge_slots = np.repeat(starts - offsets, lengths) + np.arange(total)
+        neighbors = graph.indices[edge_slots]
+        origins = np.repeat(frontier, lengths)
+
+        # Keep unvisited neighbors, one entry per vertex (first discoverer wins)
+        unvisited = ~visited[neighbors]
+        neighbors, first = np.unique(neighbors[unvisited], return_index=True)
+        origins = origins[unvisited][first]
+
+        visited[neighbors] = True
+        distances[neighbors] = level
+        parents[neighbors] = origins
+        frontier = neighbors
+
+    return distances, parents
+
+def main():
+    """Run BFS on the example graph from two start vertices"""
+    # Example adjacency matrix (same as DFS)
+    # 0 represents no edge, non-zero represents an edge
+    graph = [
+        #0  1  2  3  4  5  6
+        [0, 1, 1, 0, 0, 0, 0],  # 0
+        [1, 0, 0, 1, 1, 0, 0],  # 1
+        [1, 0, 0, 0, 1, 0, 0],  # 2
+        [0, 1, 0, 0, 0, 1, 0],  # 3
+        [0, 1, 1, 0, 0, 1, 0],  # 4
+        [0, 0, 0, 1, 1, 0, 1],  # 5
+        [0, 0, 0, 0, 0, 1, 0]   # 6
+    ]
+    
+    print("BFS traversal starting from vertex 0:")
+    bfs_path = bfs(graph, 0)
+    print(f"BFS Path: {bfs_path}")
+    
+    # Try BFS from a different starting point
+    print("\nBFS traversal starting from vertex 3:")
+    bfs_path = bfs(graph, 3)
+    print(f"BFS Path: {bfs_path}")
+    
+    # Visualize the graph (text-based)
+    print("\nGraph structure:")
+    print("0 -- 1 -- 3")
+    print("|    |    |")
+    print("2 -- 4 -- 5 -- 6")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import argparse
+import importlib
+
+# Demo name -> submodule whose main() runs it
+DEMOS = {
+    "a-star": "a_star",
+    "bfs": "bfs",
+    "dfs": "dfs",
+    "genetic": "tsp_genetic",
+    "hill-climbing": "steepest_hill",
+    "ida-star": "idda_star",
+    "iddfs": "iddfs",
+    "landmarks": "landmarks",
+    "minimax": "min_max",
+}
+
+def main(argv=None):
+    """Entry point of the ai-practicals command: run one of the examples"""
+    parser = argparse.ArgumentParser(prog="ai-practicals", description="Run one of the algorithm examples.")
+    parser.add_argument("demo", choices=sorted(DEMOS), help="example to run")
+    args = parser.parse_args(argv)
+
+    # Only the chosen example's module (and its dependencies) is imported
+    module = importlib.import_module(f"ai_practicals.{DEMOS[args.demo]}")
+    module.main()
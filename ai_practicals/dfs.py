@@ -0,0 +1,165 @@
+import numpy as np
+
+from .graph import as_graph
+
+def dfs_events(graph, start_vertex, visited=None):
+    """
+    Iterative Depth-First Search driven by an explicit stack
+
+    Visits vertices in the same order as the recursive version but never
+    recurses, so path length is not bounded by Python's recursion limit.
+    Being a generator, the caller can stop at any point and only pay for
+    the part of the graph that was actually traversed.
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start_vertex: Starting vertex for DFS
+        visited: Optional bytearray of length n marking vertices to skip
+                 (updated in place)
+
+    Yields:
+        Tuples (event, vertex, parent, time) where event is "pre" when the
+        vertex is discovered and "post" when all its neighbors are finished.
+        time is a shared clock, so it gives discovery and finish times.
+    """
+    graph = as_graph(graph)
+    if visited is None:
+        visited = bytearray(graph.num_nodes)
+    if visited[start_vertex]:
+        return
+
+    clock = 0
+    visited[start_vertex] = 1
+    yield "pre", start_vertex, -1, clock
+    clock += 1
+
+    # Each stack entry is (vertex, parent, iterator over remaining neighbors)
+    stack = [(start_vertex, -1, iter(graph.neighbors(start_vertex)))]
+
+    while stack:
+        current, parent, neighbors = stack[-1]
+
+        # Descend into the first unvisited neighbor, like the recursive call would
+        for neighbor in neighbors:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                yield "pre", neighbor, current, clock
+                clock += 1
+                stack.append((neighbor, current, iter(graph.neighbors(neighbor))))
+                break
+        else:
+            # All neighbors done: the vertex is finished
+            stack.pop()
+            yield "post", current, parent, clock
+            clock += 1
+
+def dfs_traversal(graph, start_vertex):
+    """
+    Run a full iterative DFS and collect the traversal arrays
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start_vertex: Starting vertex for DFS
+
+    Returns:
+        Dictionary with
+        - preorder: Vertices in discovery order
+        - postorder: Vertices in finish order
+        - discovery: Discovery time per vertex (-1 if unreached)
+        - finish: Finish time per vertex (-1 if unreached)
+        - parent: DFS tree parent per vertex (-1 for the start and unreached vertices)
+    """
+    graph = as_graph(graph)
+    n = graph.num_nodes
+
+    preorder = []
+    postorder = []
+    discovery = np.full(n, -1, dtype=np.int64)
+    finish = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+
+    for event, vertex, vertex_parent, time in dfs_events(graph, start_vertex):
+        if event == "pre":
+            preorder.append(vertex)
+            discovery[vertex] = time
+            parent[vertex] = vertex_parent
+        else:
+            postorder.append(vertex)
+            finish[vertex] = time
+
+    return {
+        "preorder": np.array(preorder, dtype=np.int64),
+        "postorder": np.array(postorder, dtype=np.int64),
+        "discovery": discovery,
+        "finish": finish,
+        "parent": parent,
+    }
+
+def dfs(graph, start_vertex, visited=None, path=None):
+    """
+    Depth-First Search implementation using adjacency matrix
+    
+    Args:
+        graph: 2D adjacency matrix where graph[i][j] represents edge from i to j,
+               or a CSRGraph
+        start_vertex: Starting vertex for DFS
+        visited: Set of visited vertices (updated in place)
+        path: List to track DFS traversal path (appended to in place)
+    
+    Returns:
+        List containing the DFS traversal path
+    """
+    graph = as_graph(graph)
+
+    # Initialize visited set and path list on first call
+    if visited is None:
+        visited = set()
+    if path is None:
+        path = []
+
+    # Vertices the caller already visited are skipped by the engine
+    seen = bytearray(graph.num_nodes)
+    for vertex in visited:
+        seen[vertex] = 1
+
+    for event, vertex, _, _ in dfs_events(graph, start_vertex, seen):
+        if event == "pre":
+            # Mark current vertex as visited and add to path
+            visited.add(vertex)
+            path.append(vertex)
+            print(f"Visiting vertex {vertex}")
+    
+    return path
+
+def main():
+    """Run DFS on the example graph from two start vertices"""
+    # Example adjacency matrix
+    # 0 represents no edge, non-zero represents an edge
+    graph = [
+        #0  1  2  3  4  5  6
+        [0, 1, 1, 0, 0, 0, 0],  # 0
+        [1, 0, 0, 1, 1, 0, 0],  # 1
+        [1, 0, 0, 0, 1, 0, 0],  # 2
+        [0, 1, 0, 0, 0, 1, 0],  # 3
+        [0, 1, 1, 0, 0, 1, 0],  # 4
+        [0, 0, 0, 1, 1, 0, 1],  # 5
+        [0, 0, 0, 0, 0, 1, 0]   # 6
+    ]
+    
+    print("DFS traversal starting from vertex 0:")
+    dfs_path = dfs(graph, 0)
+    print(f"DFS Path: {dfs_path}")
+    
+    # Try DFS from a different starting point
+    print("\nDFS traversal starting from vertex 3:")
+    dfs_path = dfs(graph, 3)
+    print(f"DFS Path: {dfs_path}")
+    
+    # Visualize the graph (text-based)
+    print("\nGraph structure:")
+    print("0 -- 1 -- 3")
+    print("|    |    |")
+    print("2 -- 4 -- 5 -- 6")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+class DistanceProvider(ABC):
+    """
+    Distance matrix that is never stored in full
+
+    Supports the indexing the TSP optimizers use on a NumPy matrix:
+    distances[i, j] with ints or broadcastable index arrays (including
+    np.ix_), distances[i] for whole rows, distances.item(i, j) for a single
+    Python scalar, and distances.shape. np.asarray(provider) builds the
+    full matrix, which is only sensible for small instances.
+
+    Subclasses implement pair(i, j) and may override row(i) and item(i, j).
+    symmetric tells whether pair(i, j) == pair(j, i) is known to hold, so
+    callers never need the full matrix to find out.
+    """
+    num_cities = 0
+    dtype = np.float64
+    symmetric = False
+
+    @property
+    def shape(self):
+        return (self.num_cities, self.num_cities)
+
+    def __len__(self):
+        return self.num_cities
+
+    @abstractmethod
+    def pair(self, i, j):
+        """Distances between broadcast index arrays i and j"""
+
+    def row(self, i):
+        """Distances from city i to every city"""
+        return self.pair(np.int64(i), np.arange(self.num_cities))
+
+    def item(self, i, j):
+        """Distance from city i to city j as a Python scalar"""
+        return self.pair(np.int64(i), np.int64(j)).item()
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, j = key
+            # [()] turns a 0-d result into a scalar, like indexing an ndarray with two ints
+            return self.pair(np.asarray(i), np.asarray(j))[()]
+        if np.ndim(key) == 0:
+            return self.row(int(key))
+        rows = np.asarray(key)
+        return self.pair(rows[..., None], np.arange(self.num_cities))
+
+    def __array__(self, dtype=None, copy=None):
+        matrix = self[np.arange(self.num_cities)]
+        return matrix if dtype is None else matrix.astype(dtype)
+
+def _nint(x):
+    # TSPLIB rounding to the nearest integer
+    return np.floor(x + 0.5).astype(np.int64)
+
+def _geo_radians(coordinate):
+    # TSPLIB GEO coordinates are DDD.MM (degrees and minutes)
+    degrees = np.trunc(coordinate)
+    minutes = coordinate - degrees
+    return 3.141592 * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+def _euclidean(a, b):
+    return np.sqrt(((a - b) ** 2).sum(axis=-1))
+
+def _att(a, b):
+    r = np.sqrt(((a - b) ** 2).sum(axis=-1) / 10.0)
+    t = _nint(r)
+    return np.where(t < r, t + 1, t)
+
+def _geo(a, b):
+    # a and b hold (latitude, longitude) already converted with _geo_radians
+    q1 = np.cos(a[..., 1] - b[..., 1])
+    q2 = np.cos(a[..., 0] - b[..., 0])
+    q3 = np.cos(a[..., 0] + b[..., 0])
+    cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+    return (6378.388 * np.arccos(cosine) + 1.0).astype(np.int64)
+
+# Vectorized distance per metric, and the dtype it produces
+METRICS = {
+    "euclidean": (_euclidean, np.float64),
+    "euc_2d": (lambda a, b: _nint(_euclidean(a, b)), np.int64),
+    "ceil_2d": (lambda a, b: np.ceil(_euclidean(a, b)).astype(np.int64), np.int64),
+    "att": (_att, np.int64),
+    "geo": (_geo, np.int64),
+}
+
+class CoordinateDistances(DistanceProvider):
+    """
+    Distances computed on the fly from city coordinates
+
+    Only the n coordinates are stored. Any block of distances is computed
+    with vectorized NumPy operations when it is indexed, and the most
+    recently used full rows are kept in an LRU row cache.
+
+    Args:
+        coordinates: Array of shape (n, 2) (or (n, d) for "euclidean")
+        metric: "euclidean", or a TSPLIB metric: "euc_2d", "ceil_2d", "att" or "geo"
+        row_cache_size: Number of rows kept in the row cache
+    """
+    symmetric = True  # every metric is
+
+    def __init__(self, coordinates, metric="euclidean", row_cache_size=1024):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        self.coordinates = np.asarray(coordinates, dtype=np.float64)
+        self.metric = metric
+        self.function, self.dtype = METRICS[metric]
+        self.num_cities = len(self.coordinates)
+        self.row_cache_size = row_cache_size
+        self.rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # GEO works on radians; converting once keeps every lookup cheap
+        self.points = _geo_radians(self.coordinates) if metric == "geo" else self.coordinates
+        self.point_list = self.points.tolist()
+
+    def pair(self, i, j):
+        distances = self.function(self.points[i], self.points[j])
+        # A city is always at distance 0 from itself (GEO would give 1)
+        return np.where(i == j, 0, distances).astype(self.dtype)
+
+    def row(self, i):
+        cached = self.rows.get(i)
+        if cached is not None:
+            self.hits += 1
+            self.rows.move_to_end(i)
+            return cached
+
+        self.misses += 1
+        values = self.pair(np.int64(i), np.arange(self.num_cities))
+        values.flags.writeable = False
+        self.rows[i] = values
+        if len(self.rows) > self.row_cache_size:
+            self.rows.popitem(last=False)
+        return values
+
+    def item(self, i, j):
+        if self.metric not in ("euclidean", "euc_2d"):
+            return self.pair(np.int64(i), np.int64(j)).item()
+
+        # Plain Python math is much faster than NumPy for a single pair
+        distance = math.dist(self.point_list[i], self.point_list[j])
+        return distance if self.metric == "euclidean" else int(distance + 0.5)
+
+    def __getstate__(self):
+        # The row cache is rebuilt on demand instead of being pickled
+        state = self.__dict__.copy()
+        state["rows"] = OrderedDict()
+        state.pop("function")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.function = METRICS[self.metric][0]
+
+class NpyDistances(DistanceProvider):
+    """
+    Full distance matrix in a .npy file, memory-mapped instead of loaded
+
+    Pages are read from disk as rows are touched. Pickling keeps only the
+    path, so worker processes reopen the file instead of copying it.
+
+    Args:
+        path: Path of a .npy file written with np.save
+    """
+    def __init__(self, path):
+        self.path = path
+        self.matrix = np.load(path, mmap_mode="r")
+        self.num_cities = self.matrix.shape[0]
+        self.dtype = self.matrix.dtype
+
+    def pair(self, i, j):
+        return self.matrix[i, j]
+
+    def row(self, i):
+        return self.matrix[i]
+
+    def item(self, i, j):
+        return self.matrix.item(i, j)
+
+    def __getitem__(self, key):
+        return self.matrix[key]
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+def _explicit_matrix(weights, dimension, edge_weight_format):
+    """Full matrix from the numbers of a TSPLIB EDGE_WEIGHT_SECTION"""
+    weights = np.asarray(weights, dtype=np.float64)
+    if np.all(weights == np.round(weights)):
+        weights = weights.astype(np.int64)
+
+    if edge_weight_format == "FULL_MATRIX":
+        return weights[:dimension * dimension].reshape(dimension, dimension)
+
+    # For a symmetric matrix, the column-wise formats list the same numbers
+    # as the opposite row-wise ones
+    triangles = {
+        "UPPER_ROW": (np.triu_indices, 1), "LOWER_COL": (np.triu_indices, 1),
+        "LOWER_ROW": (np.tril_indices, -1), "UPPER_COL": (np.tril_indices, -1),
+        "UPPER_DIAG_ROW": (np.triu_indices, 0), "LOWER_DIAG_COL": (np.triu_indices, 0),
+        "LOWER_DIAG_ROW": (np.tril_indices, 0), "UPPER_DIAG_COL": (np.tril_indices, 0),
+    }
+    if edge_weight_format not in triangles:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {edge_weight_format}")
+    indices, offset = triangles[edge_weight_format]
+    rows, columns = indices(dimension, offset)
+
+    matrix = np.zeros((dimension, dimension), dtype=weights.dtype)
+    matrix[rows, columns] = weights[:len(rows)]
+    matrix[columns, rows] = weights[:len(rows)]
+    return matrix
+
+def load_tsplib(path, row_cache_size=1024):
+    """
+    Load a symmetric TSP instance in TSPLIB format
+
+    Coordinate instances (EUC_2D, CEIL_2D, ATT, GEO) become a lazy
+    CoordinateDistances; EXPLICIT instances become a NumPy matrix.
+    Cities are numbered from 0 in file order.
+
+    Args:
+        path: Path of the .tsp file
+        row_cache_size: Row cache size for coordinate instances
+
+    Returns:
+        CoordinateDistances or 2D NumPy array
+    """
+    header = {}
+    coordinates = []
+    weights = []
+    section = None
+
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if not line or line == "EOF":
+                continue
+            if line.endswith("_SECTION"):
+                section = line
+                continue
+            if ":" in line and not line[0].isdigit() and line[0] not in "+-.":
+                key, value = line.split(":", 1)
+                header[key.strip().upper()] = value.strip()
+                section = None
+                continue
+
+            if section == "NODE_COORD_SECTION":
+                coordinates.append([float(value) for value in line.split()[1:]])
+            elif section == "EDGE_WEIGHT_SECTION":
+                weights.extend(float(value) for value in line.split())
+
+    dimension = int(header["DIMENSION"])
+    edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "EXPLICIT").upper()
+
+    if edge_weight_type == "EXPLICIT":
+        edge_weight_format = header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+        return _explicit_matrix(weights, dimension, edge_weight_format)
+
+    metric = edge_weight_type.lower()
+    if metric not in METRICS or metric == "euclidean":
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+    return CoordinateDistances(coordinates[:dimension], metric, row_cache_size)
+
+def as_distances(distances):
+    """
+    Accept a matrix, a DistanceProvider or a file path wherever distances are expected
+
+    NumPy arrays (and nested lists) are returned as arrays, so existing
+    callers keep working unchanged. A path ending in .npy is memory-mapped
+    and any other path is read as a TSPLIB file.
+    """
+    if isinstance(distances, (DistanceProvider, np.ndarray)):
+        return distances
+    if isinstance(distances, str):
+        if distances.endswith(".npy"):
+            return NpyDistances(distances)
+        return load_tsplib(distances)
+    return np.asarray(distances)
+
+class SharedMatrix:
+    """Picklable handle to a distance matrix placed in shared memory"""
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def attach(self):
+        """Array view of the shared matrix (the handle keeps the segment open)"""
+        self.shm = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    def __getstate__(self):
+        return {"name": self.name, "shape": self.shape, "dtype": self.dtype}
+
+@contextmanager
+def shared_distances(distances):
+    """
+    Picklable stand-in for distances to hand to worker processes
+
+    In-memory matrices are copied into shared memory once (and released on
+    exit). Providers are passed as they are: they pickle as coordinates or a
+    file path, which is already small.
+    """
+    if type(distances) is not np.ndarray:
+        yield distances
+        return
+
+    distances = np.ascontiguousarray(distances)
+    shm = shared_memory.SharedMemory(create=True, size=max(distances.nbytes, 1))
+    try:
+        np.ndarray(distances.shape, dtype=distances.dtype, buffer=shm.buf)[...] = distances
+        yield SharedMatrix(shm.name, distances.shape, distances.dtype)
+    finally:
+        shm.close()
+        shm.unlink()
+
+def attach_distances(handle):
+    """Inverse of shared_distances, called once in each worker"""
+    if isinstance(handle, SharedMatrix):
+        return handle.attach()
+    return handle
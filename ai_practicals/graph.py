@@ -0,0 +1,133 @@
+import numpy as np
+
+class CSRGraph:
+    """
+    Compressed Sparse Row (CSR) graph representation
+
+    The neighbors of vertex v are indices[indptr[v]:indptr[v+1]] and the
+    matching edge costs are weights[indptr[v]:indptr[v+1]]. Neighbors are
+    stored in ascending order, so searches visit them in the same order as
+    a `for neighbor in range(n)` scan over an adjacency matrix.
+
+    Args:
+        indptr: Array of length num_nodes + 1 with the row offsets
+        indices: Array with the target vertex of every edge
+        weights: Array with the cost of every edge (defaults to 1 for each edge)
+    """
+    def __init__(self, indptr, indices, weights=None):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(self.indices), dtype=np.int64)
+        self.weights = np.asarray(weights)
+        self.num_nodes = len(self.indptr) - 1
+
+        if len(self.indices) != len(self.weights):
+            raise ValueError("indices and weights must have the same length")
+        if self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr[-1] must equal the number of edges")
+
+    @classmethod
+    def from_matrix(cls, matrix, no_edge=0):
+        """
+        Build a CSR graph from a 2D adjacency matrix
+
+        Args:
+            matrix: 2D adjacency matrix where matrix[i][j] is the edge from i to j
+            no_edge: Value that marks a missing edge (0 for bfs/dfs/iddfs,
+                     float('inf') for the weighted searches)
+
+        Returns:
+            CSRGraph with one edge per matrix cell that is not `no_edge`
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+
+        # Keep every cell that holds a real edge (row-major, so columns stay sorted)
+        mask = matrix != no_edge
+        indptr = np.zeros(matrix.shape[0] + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=indptr[1:])
+        indices = np.nonzero(mask)[1]
+        weights = matrix[mask]
+
+        # Keep integer costs as ints so path costs come out the same as with the matrix
+        if np.all(weights == np.floor(weights)):
+            weights = weights.astype(np.int64)
+
+        return cls(indptr, indices, weights)
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, undirected=False):
+        """
+        Build a CSR graph from an edge list without materializing a matrix
+
+        Args:
+            num_nodes: Number of vertices in the graph
+            edges: Iterable of (u, v) or (u, v, cost) tuples
+            undirected: If True, every edge is also added in the v -> u direction
+
+        Returns:
+            CSRGraph containing the given edges
+        """
+        # One array per column, so endpoints never go through float
+        if isinstance(edges, np.ndarray):
+            columns = [edges[:, k] for k in range(edges.shape[1])] if edges.size else []
+        else:
+            columns = [np.asarray(column) for column in zip(*edges)]
+        if not columns:
+            columns = [np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)]
+        sources = columns[0].astype(np.int64)
+        targets = columns[1].astype(np.int64)
+        costs = columns[2] if len(columns) > 2 else np.ones(len(sources), dtype=np.int64)
+
+        # Keep integer costs as ints, like from_matrix
+        if costs.dtype.kind == "f" and np.all(costs == np.floor(costs)):
+            costs = costs.astype(np.int64)
+
+        if undirected:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            costs = np.concatenate([costs, costs])
+
+        # Sort by (source, target) so neighbors come out in ascending order
+        order = np.lexsort((targets, sources))
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+
+        return cls(indptr, targets[order], costs[order])
+
+    def __len__(self):
+        return self.num_nodes
+
+    def neighbors(self, vertex):
+        """Return the neighbors of a vertex as a list of ints"""
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]].tolist()
+
+    def edges(self, vertex):
+        """Return (neighbor, cost) pairs for every outgoing edge of a vertex"""
+        start, end = self.indptr[vertex], self.indptr[vertex + 1]
+        return zip(self.indices[start:end].tolist(), self.weights[start:end].tolist())
+
+    def reverse(self):
+        """Return a new CSRGraph with every edge direction flipped"""
+        sources = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+
+        # Group edges by their target, which becomes the new source
+        order = np.lexsort((sources, self.indices))
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.num_nodes), out=indptr[1:])
+
+        return CSRGraph(indptr, sources[order], self.weights[order])
+
+def as_graph(graph, no_edge=0):
+    """
+    Return the graph as a CSRGraph, converting an adjacency matrix if needed
+
+    Args:
+        graph: CSRGraph or 2D adjacency matrix
+        no_edge: Value that marks a missing edge in the matrix
+
+    Returns:
+        CSRGraph (the same object if one was passed in)
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_matrix(graph, no_edge)
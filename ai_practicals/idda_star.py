@@ -0,0 +1,415 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .graph import as_graph
+
+class FileTraceSink:
+    """
+    Trace sink that writes one tab-separated line per search event
+
+    The file is only opened when the first event arrives, so a sink that is
+    passed in but never used costs nothing.
+
+    Args:
+        filename: Path of the trace file (overwritten)
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+
+    def __call__(self, event):
+        if self.file is None:
+            self.file = open(self.filename, "w")
+            self.file.write("threshold\tnode\tdepth\tf_cost\tstatus\n")
+        self.file.write("\t".join(str(field) for field in event) + "\n")
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def print_trace(event):
+    """Trace sink that prints every search event"""
+    threshold, node, depth, f_cost, status = event
+    print(f"[threshold {threshold}] node {node} (depth {depth}, f-cost {f_cost}) - {status}")
+
+def ida_star_search_with_stats(graph, start_node, goal_node, heuristic_costs, trace=None):
+    """
+    Iterative Deepening A* Search that also reports search statistics
+
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: List of heuristic costs from each node to goal
+        trace: Optional callable receiving (threshold, node, depth, f_cost, status)
+               events, e.g. print_trace or a FileTraceSink. Off by default.
+
+    Returns:
+        path: List of node indices representing the optimal path
+        total_cost: Total cost of the path
+        stats: Dictionary with "iterations" and "nodes_generated" (summed over all thresholds)
+    """
+    # Sparse view of the graph so we only look at real edges
+    graph = as_graph(graph, no_edge=float('inf'))
+
+    # Initial threshold is the heuristic cost from start to goal
+    threshold = heuristic_costs[start_node]
+
+    iteration = 1
+    nodes_generated = 0
+
+    while True:
+        # Initialize search path and visited nodes
+        path = []
+        visited = set()
+
+        # Initial call to recursive search function
+        result, cost, new_threshold, nodes = search(
+            graph, start_node, goal_node, 0, threshold,
+            heuristic_costs, path, visited, 0, trace
+        )
+        nodes_generated += nodes
+        stats = {"iterations": iteration, "nodes_generated": nodes_generated}
+
+        # Path found
+        if result:
+            return path, cost, stats
+
+        # No solution exists
+        if new_threshold == float('inf'):
+            return None, float('inf'), stats
+
+        # Update threshold and try again
+        threshold = new_threshold
+        iteration += 1
+
+        # For safety - if we somehow get stuck
+        if threshold > 1000:  # Arbitrary large number
+            return None, float('inf'), stats
+
+def ida_star_search(graph, start_node, goal_node, heuristic_costs, trace=None):
+    """
+    Iterative Deepening A* Search using adjacency matrix representation
+    
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: List of heuristic costs from each node to goal
+        trace: Optional trace sink, see ida_star_search_with_stats
+    
+    Returns:
+        path: List of node indices representing the optimal path
+        total_cost: Total cost of the path
+    """
+    path, total_cost, _ = ida_star_search_with_stats(graph, start_node, goal_node, heuristic_costs, trace)
+    return path, total_cost
+
+def search(graph, current, goal, g_cost, threshold, heuristic, path, visited,
+           depth=0, trace=None):
+    """
+    Recursive search function for IDA*
+    
+    Args:
+        graph: CSRGraph
+        current: Current node index
+        goal: Goal node index
+        g_cost: Cost from start to current
+        threshold: Current f-cost threshold
+        heuristic: List of heuristic values to goal
+        path: Current path (will be modified)
+        visited: Set of visited nodes
+        depth: Current depth in search tree
+        trace: Optional callable receiving (threshold, node, depth, f_cost, status)
+    
+    Returns:
+        Tuple of (found_path, path_cost, next_threshold, nodes_generated)
+    """
+    # Add current node to path
+    path.append(current)
+    visited.add(current)
+    
+    # Calculate f_cost (g + h)
+    f_cost = g_cost + heuristic[current]
+    
+    # If f_cost exceeds threshold, return minimum f_cost for next iteration
+    if f_cost > threshold:
+        path.pop()
+        visited.remove(current)
+        if trace is not None:
+            trace((threshold, current, depth, f_cost, "PRUNED"))
+        return False, 0, f_cost, 1
+    
+    # Goal found
+    if current == goal:
+        if trace is not None:
+            trace((threshold, current, depth, f_cost, "GOAL"))
+        return True, g_cost, threshold, 1
+    
+    if trace is not None:
+        trace((threshold, current, depth, f_cost, "EXPLORED"))
+    
+    # Track minimum f_cost exceeding threshold for next iteration
+    min_threshold = float('inf')
+    nodes_generated = 1
+    
+    # Explore neighbors
+    for neighbor, edge_cost in graph.edges(current):
+        # Skip if already visited
+        if neighbor in visited:
+            continue
+        
+        # Recursive search from neighbor
+        found, cost, new_threshold, nodes = search(
+            graph, neighbor, goal, g_cost + edge_cost, threshold,
+            heuristic, path, visited, depth + 1, trace
+        )
+        nodes_generated += nodes
+        
+        # If path found, return success
+        if found:
+            return True, cost, new_threshold, nodes_generated
+        
+        # Update minimum threshold
+        min_threshold = min(min_threshold, new_threshold)
+    
+    # Backtrack
+    path.pop()
+    visited.remove(current)
+    
+    # No path found with current threshold
+    return False, 0, min_threshold, nodes_generated
+
+class _Cancelled(Exception):
+    """Raised inside a worker when an earlier subtree already found the goal"""
+
+# Per-process state for parallel IDA* workers, set once by _init_worker
+_worker_state = {}
+
+def _init_worker(graph, goal, heuristic, found_index):
+    _worker_state.update(graph=graph, goal=goal, heuristic=heuristic, found_index=found_index)
+
+def _search_subtree(index, prefix, root, g_cost, threshold):
+    """
+    Search one frontier subtree for the current threshold in a worker process
+
+    Returns:
+        Tuple of (index, found_path, path, path_cost, next_threshold, nodes_generated)
+    """
+    found_index = _worker_state["found_index"]
+    nodes = 0
+
+    # An earlier subtree already holds the answer, this one can't change it
+    if found_index.value < index:
+        return index, False, None, 0, float('inf'), 0
+
+    def check_cancelled(event):
+        nonlocal nodes
+        nodes += 1
+        if nodes % 1024 == 0 and found_index.value < index:
+            raise _Cancelled
+
+    path = list(prefix)
+    try:
+        found, cost, next_threshold, nodes = search(
+            _worker_state["graph"], root, _worker_state["goal"], g_cost, threshold,
+            _worker_state["heuristic"], path, set(prefix), len(prefix), check_cancelled
+        )
+    except _Cancelled:
+        return index, False, None, 0, float('inf'), nodes
+
+    if found:
+        # Let later subtrees stop early
+        with found_index.get_lock():
+            found_index.value = min(found_index.value, index)
+
+    return index, found, path if found else None, cost, next_threshold, nodes
+
+def _split_frontier(graph, current, goal, g_cost, threshold, heuristic, path, visited,
+                    depth, split_depth, items):
+    """
+    Expand the top of the IDA* tree down to split_depth, in DFS order
+
+    Appends ("subtree", prefix, node, g_cost) for every node at split_depth and
+    ("goal", path, g_cost) when the goal is reached above it, so the item
+    order matches the order the sequential search would visit them in.
+
+    Returns:
+        Tuple of (min f_cost exceeding threshold above split_depth, nodes_generated)
+    """
+    if depth == split_depth:
+        items.append(("subtree", list(path), current, g_cost))
+        return float('inf'), 0
+
+    f_cost = g_cost + heuristic[current]
+    if f_cost > threshold:
+        return f_cost, 1
+
+    if current == goal:
+        items.append(("goal", path + [current], g_cost))
+        return float('inf'), 1
+
+    path.append(current)
+    visited.add(current)
+    min_threshold = float('inf')
+    nodes_generated = 1
+
+    for neighbor, edge_cost in graph.edges(current):
+        if neighbor in visited:
+            continue
+        new_threshold, nodes = _split_frontier(
+            graph, neighbor, goal, g_cost + edge_cost, threshold, heuristic,
+            path, visited, depth + 1, split_depth, items
+        )
+        min_threshold = min(min_threshold, new_threshold)
+        nodes_generated += nodes
+
+    path.pop()
+    visited.remove(current)
+    return min_threshold, nodes_generated
+
+def parallel_ida_star_search(graph, start_node, goal_node, heuristic_costs,
+                             workers=None, split_depth=1):
+    """
+    IDA* that searches the subtrees below split_depth in a process pool
+
+    For every threshold the tree is expanded sequentially down to split_depth
+    and each frontier node's subtree is searched by a worker. The next
+    threshold is the minimum exceeded f-cost over all workers. When a worker
+    reaches the goal, every subtree that comes later in DFS order is
+    cancelled; earlier ones finish so the result is the same path the
+    sequential ida_star_search returns.
+
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        start_node: Index of the starting node
+        goal_node: Index of the goal node
+        heuristic_costs: List of heuristic costs from each node to goal
+        workers: Number of worker processes (defaults to the CPU count)
+        split_depth: Depth of the frontier whose subtrees are handed to workers
+
+    Returns:
+        path: List of node indices representing the optimal path
+        total_cost: Total cost of the path
+        stats: Dictionary with "iterations" and "nodes_generated"
+    """
+    graph = as_graph(graph, no_edge=float('inf'))
+    context = multiprocessing.get_context()
+    found_index = context.Value('q', 0)
+
+    threshold = heuristic_costs[start_node]
+    iteration = 1
+    nodes_generated = 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker,
+        initargs=(graph, goal_node, heuristic_costs, found_index)
+    ) as pool:
+        while True:
+            items = []
+            new_threshold, nodes = _split_frontier(
+                graph, start_node, goal_node, 0, threshold, heuristic_costs,
+                [], set(), 0, split_depth, items
+            )
+            nodes_generated += nodes
+
+            # Goals found while splitting count as already-finished subtrees
+            results = {}
+            for index, item in enumerate(items):
+                if item[0] == "goal":
+                    results[index] = (True, item[1], item[2], float('inf'))
+            found_index.value = min(results, default=len(items))
+
+            futures = [
+                pool.submit(_search_subtree, index, item[1], item[2], item[3], threshold)
+                for index, item in enumerate(items) if item[0] == "subtree"
+            ]
+            for future in as_completed(futures):
+                index, found, path, cost, next_threshold, nodes = future.result()
+                results[index] = (found, path, cost, next_threshold)
+                nodes_generated += nodes
+
+            stats = {"iterations": iteration, "nodes_generated": nodes_generated}
+
+            # The earliest subtree (in DFS order) with a solution wins
+            solved = [index for index, result in results.items() if result[0]]
+            if solved:
+                _, path, cost, _ = results[min(solved)]
+                return path, cost, stats
+
+            new_threshold = min([new_threshold] + [result[3] for result in results.values()])
+
+            # No solution exists
+            if new_threshold == float('inf'):
+                return None, float('inf'), stats
+
+            # Update threshold and try again
+            threshold = new_threshold
+            iteration += 1
+
+            # Same safety limit as the sequential search
+            if threshold > 1000:
+                return None, float('inf'), stats
+
+def main():
+    """Run IDA* on the 7 node graph, printing every generated node"""
+    # Define a simple graph with 7 nodes (0-6)
+    # Using adjacency matrix representation
+    inf = float('inf')
+    graph = [
+        #0    1    2    3    4    5    6
+        [0,   2,   4,   inf, inf, inf, inf], # 0
+        [2,   0,   1,   7,   inf, inf, inf], # 1
+        [4,   1,   0,   inf, 3,   inf, inf], # 2
+        [inf, 7,   inf, 0,   2,   1,   inf], # 3
+        [inf, inf, 3,   2,   0,   5,   2],   # 4
+        [inf, inf, inf, 1,   5,   0,   3],   # 5
+        [inf, inf, inf, inf, 2,   3,   0]    # 6
+    ]
+    
+    # Heuristic costs to goal node (node 6)
+    # These are estimated costs from each node to the goal
+    heuristic_costs = [
+        7,  # node 0 -> goal
+        6,  # node 1 -> goal
+        5,  # node 2 -> goal
+        3,  # node 3 -> goal
+        2,  # node 4 -> goal
+        1,  # node 5 -> goal
+        0   # node 6 -> goal (goal itself)
+    ]
+    
+    # Find path from node 0 to node 6
+    start_node = 0
+    goal_node = 6
+    
+    # Print every node the search generates
+    path, cost = ida_star_search(graph, start_node, goal_node, heuristic_costs, trace=print_trace)
+    
+    print("\n=== FINAL IDA* SEARCH RESULTS ===")
+    if path:
+        print(f"Optimal path found: {' -> '.join(str(node) for node in path)}")
+        print(f"Total cost: {cost}")
+        
+        # Print each step of the path with its cost
+        print("\nDetailed path:")
+        for i in range(len(path)-1):
+            current = path[i]
+            next_node = path[i+1]
+            step_cost = graph[current][next_node]
+            print(f"Vertex {current} -> Vertex {next_node}: Cost = {step_cost}")
+    else:
+        print("No path found!")
+
+if __name__ == "__main__":
+    main()
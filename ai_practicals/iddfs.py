@@ -0,0 +1,271 @@
+from .graph import as_graph
+
+def depth_limited_dfs(graph, current, goal, depth_limit, visited=None, path=None):
+    """
+    Depth-Limited DFS implementation
+    
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        current: Current vertex
+        goal: Goal vertex to find
+        depth_limit: Maximum depth to search
+        visited: Set of visited vertices (updated in place and restored on backtrack)
+        path: Current path being explored (updated in place and restored on backtrack)
+    
+    Returns:
+        Tuple (found, path) where found is boolean and path is the path to goal
+    """
+    # Convert to CSR once; recursive calls receive the converted graph
+    graph = as_graph(graph)
+
+    # Initialize visited and path if this is the first call
+    if visited is None:
+        visited = set()
+    if path is None:
+        path = []
+    
+    # Add current vertex to path and visited
+    path.append(current)
+    visited.add(current)
+    
+    # Check if we found the goal
+    if current == goal:
+        return True, path
+    
+    # Explore neighbors within depth limit
+    if depth_limit > 0:
+        for neighbor in graph.neighbors(current):
+            if neighbor not in visited:
+                found, path = depth_limited_dfs(
+                    graph, neighbor, goal, depth_limit - 1, visited, path
+                )
+                if found:
+                    return True, path
+    
+    # Goal not found in this path, backtrack
+    path.pop()
+    visited.remove(current)
+    return False, path
+
+def depth_limited_search(graph, start, goal, depth_limit, shallowest=None):
+    """
+    Iterative depth-limited DFS with transposition pruning
+
+    The path is a single list updated with push/pop. A table records the
+    shallowest depth at which each vertex was reached in this iteration, and
+    a vertex reached again at an equal or greater depth is skipped: its
+    subtree was already searched with at least as much depth left. Vertices
+    on the current path are always shallower, so the table also stands in
+    for the visited set.
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start: Starting vertex
+        goal: Goal vertex to find, or a set of vertices any of which is a goal
+        depth_limit: Maximum depth to search
+        shallowest: Optional dict that receives the depth table (vertex -> depth)
+
+    Returns:
+        Tuple (found, path, nodes_generated, cutoff) where cutoff tells whether
+        any vertex was cut off by the depth limit (if not, deeper limits can't help)
+    """
+    graph = as_graph(graph)
+    goals = goal if isinstance(goal, (set, frozenset)) else {goal}
+    if shallowest is None:
+        shallowest = {}
+
+    path = [start]
+    shallowest[start] = 0
+    nodes_generated = 1
+    cutoff = False
+
+    if start in goals:
+        return True, path, nodes_generated, cutoff
+
+    # Each stack entry is the iterator over the remaining neighbors of path[-1]
+    stack = [iter(graph.neighbors(start))] if depth_limit > 0 else []
+    cutoff = depth_limit == 0 and len(graph.neighbors(start)) > 0
+
+    while stack:
+        depth = len(path)
+        for neighbor in stack[-1]:
+            # Prune equal-or-worse revisits
+            if shallowest.get(neighbor, depth + 1) <= depth:
+                continue
+
+            shallowest[neighbor] = depth
+            nodes_generated += 1
+
+            if neighbor in goals:
+                path.append(neighbor)
+                return True, path, nodes_generated, cutoff
+
+            neighbors = graph.neighbors(neighbor)
+            if depth < depth_limit:
+                path.append(neighbor)
+                stack.append(iter(neighbors))
+                break
+            if neighbors:
+                cutoff = True
+        else:
+            # All neighbors done, backtrack
+            stack.pop()
+            path.pop()
+
+    return False, None, nodes_generated, cutoff
+
+def iddfs_with_stats(graph, start, goal, max_depth=float('inf')):
+    """
+    Iterative Deepening DFS built on depth_limited_search
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start: Starting vertex
+        goal: Goal vertex to find
+        max_depth: Maximum depth to search
+
+    Returns:
+        Tuple (path, nodes_per_depth) where path is None if the goal was not
+        found and nodes_per_depth[d] is the number of nodes generated with limit d
+    """
+    graph = as_graph(graph)
+    nodes_per_depth = []
+
+    depth = 0
+    while depth <= max_depth:
+        found, path, nodes, cutoff = depth_limited_search(graph, start, goal, depth)
+        nodes_per_depth.append(nodes)
+
+        if found:
+            return path, nodes_per_depth
+
+        # Every reachable vertex was searched, a deeper limit finds nothing new
+        if not cutoff:
+            break
+        depth += 1
+
+    return None, nodes_per_depth  # Goal not found within max_depth
+
+def iddfs(graph, start, goal, max_depth=float('inf')):
+    """
+    Iterative Deepening Depth-First Search
+    
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start: Starting vertex
+        goal: Goal vertex to find
+        max_depth: Maximum depth to search
+    
+    Returns:
+        Path to goal if found, None otherwise
+    """
+    path, nodes_per_depth = iddfs_with_stats(graph, start, goal, max_depth)
+
+    for depth, nodes in enumerate(nodes_per_depth):
+        print(f"\n--- Searched with depth limit: {depth} ({nodes} nodes generated) ---")
+    
+    return path
+
+def bidirectional_iddfs(graph, start, goal, max_depth=float('inf'), reverse_graph=None):
+    """
+    Bidirectional Iterative Deepening DFS for point-to-point queries
+
+    Iteration k runs a depth-limited search to depth k from the start and
+    keeps only the vertices first reached at exactly depth k, in a hashed
+    set. A depth-limited search from the goal over the reversed graph, to
+    depth k and then k + 1, looks for one of those vertices. This checks all
+    paths of length 2k and 2k + 1, so the first meeting gives a shortest
+    path, while each side only searches to about half the solution depth.
+
+    Args:
+        graph: 2D adjacency matrix or CSRGraph
+        start: Starting vertex
+        goal: Goal vertex to find
+        max_depth: Maximum path length to search
+        reverse_graph: Optional precomputed graph.reverse(), to reuse across queries
+
+    Returns:
+        Path to goal if found, None otherwise
+    """
+    graph = as_graph(graph)
+    if reverse_graph is None:
+        reverse_graph = graph.reverse()
+
+    k = 0
+    while 2 * k <= max_depth:
+        # Forward half: vertices exactly k steps from the start
+        shallowest = {}
+        _, _, _, cutoff = depth_limited_search(graph, start, set(), k, shallowest)
+        frontier = {vertex for vertex, depth in shallowest.items() if depth == k}
+
+        # Backward half: paths of length 2k, then 2k + 1
+        for backward_limit in (k, k + 1):
+            if k + backward_limit > max_depth:
+                break
+            found, backward_path, _, _ = depth_limited_search(reverse_graph, goal, frontier, backward_limit)
+
+            if found:
+                # Rebuild the forward half up to the meeting vertex and join the two
+                meeting = backward_path[-1]
+                _, forward_path, _, _ = depth_limited_search(graph, start, meeting, k)
+                return forward_path + backward_path[-2::-1]
+
+        # Every vertex reachable from the start was searched, longer paths don't exist
+        if not cutoff:
+            break
+        k += 1
+
+    return None  # Goal not found within max_depth
+
+def main():
+    """Run IDDFS on the example graph"""
+    # Example adjacency matrix from DFS
+    graph = [
+        #0  1  2  3  4  5  6
+        [0, 1, 1, 0, 0, 0, 0],  # 0
+        [1, 0, 0, 1, 1, 0, 0],  # 1
+        [1, 0, 0, 0, 1, 0, 0],  # 2
+        [0, 1, 0, 0, 0, 1, 0],  # 3
+        [0, 1, 1, 0, 0, 1, 0],  # 4
+        [0, 0, 0, 1, 1, 0, 1],  # 5
+        [0, 0, 0, 0, 0, 1, 0]   # 6
+    ]
+    
+    # Visualize the graph
+    print("Graph structure:")
+    print("0 -- 1 -- 3")
+    print("|    |    |")
+    print("2 -- 4 -- 5 -- 6")
+    
+    # Get user input for start and goal vertices
+    try:
+        start_vertex = int(input("\nEnter start vertex (0-6): "))
+        goal_vertex = int(input("Enter goal vertex (0-6): "))
+        
+        if not (0 <= start_vertex < len(graph) and 0 <= goal_vertex < len(graph)):
+            raise ValueError("Vertices must be between 0 and 6")
+        
+        print(f"\nFinding path from vertex {start_vertex} to vertex {goal_vertex} using IDDFS...")
+        path = iddfs(graph, start_vertex, goal_vertex, len(graph))
+        
+        if path:
+            print(f"\nPath found: {' -> '.join(map(str, path))}")
+            print(f"Path length: {len(path) - 1}")
+        else:
+            print(f"\nNo path exists from vertex {start_vertex} to vertex {goal_vertex}")
+            
+    except ValueError as e:
+        print(f"Error: {e}")
+    
+    # Example with predefined start and goal (comment out if using user input)
+    # start_vertex = 0
+    # goal_vertex = 6
+    # print(f"\nFinding path from vertex {start_vertex} to vertex {goal_vertex} using IDDFS...")
+    # path = iddfs(graph, start_vertex, goal_vertex, len(graph))
+    # if path:
+    #     print(f"\nPath found: {' -> '.join(map(str, path))}")
+    # else:
+    #     print(f"\nNo path exists from vertex {start_vertex} to vertex {goal_vertex}")
+
+if __name__ == "__main__":
+    main()
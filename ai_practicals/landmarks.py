@@ -0,0 +1,225 @@
+import heapq
+
+import numpy as np
+
+from .graph import as_graph
+
+def shortest_path_distances(graph, source):
+    """
+    Dijkstra's algorithm from a single source to every node
+
+    Args:
+        graph: 2D array where graph[i][j] is the cost from node i to node j (inf if no edge),
+               or a CSRGraph
+        source: Index of the source node
+
+    Returns:
+        Array of length n with the shortest distance to every node (inf if unreachable)
+    """
+    graph = as_graph(graph, no_edge=float('inf'))
+    distances = [float('inf')] * graph.num_nodes
+    distances[source] = 0
+    queue = [(0, source)]
+
+    while queue:
+        dist, current = heapq.heappop(queue)
+
+        # Skip stale entries
+        if dist > distances[current]:
+            continue
+
+        for neighbor, edge_cost in graph.edges(current):
+            new_dist = dist + edge_cost
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                heapq.heappush(queue, (new_dist, neighbor))
+
+    return np.array(distances, dtype=np.float64)
+
+class LandmarkHeuristic:
+    """
+    ALT (A*, Landmarks, Triangle inequality) heuristic
+
+    For a landmark L the triangle inequality gives two lower bounds on the
+    distance from v to the goal:
+        d(L, goal) - d(L, v)   and   d(v, L) - d(goal, L)
+    The heuristic is the largest of these bounds over all landmarks, which is
+    admissible for any goal, so one precomputation serves every query.
+
+    Args:
+        landmarks: Array with the K landmark node indices
+        distances: Array of shape (2, K, n); distances[0, k] holds d(landmark_k, v)
+                   and distances[1, k] holds d(v, landmark_k)
+    """
+    def __init__(self, landmarks, distances):
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+
+    @classmethod
+    def build(cls, graph, num_landmarks, seed=None):
+        """
+        Pick landmarks by farthest-point selection and compute their distance tables
+
+        Args:
+            graph: 2D adjacency matrix (inf if no edge) or CSRGraph
+            num_landmarks: Number of landmarks K
+            seed: Seed for the random node the selection starts from
+
+        Returns:
+            LandmarkHeuristic for the graph
+        """
+        graph = as_graph(graph, no_edge=float('inf'))
+        reverse_graph = graph.reverse()
+        n = graph.num_nodes
+        num_landmarks = min(num_landmarks, n)
+        rng = np.random.default_rng(seed)
+
+        # The first landmark is the node farthest from a random start node
+        seed_distances = shortest_path_distances(graph, int(rng.integers(n)))
+        seed_distances[np.isinf(seed_distances)] = -1
+        landmark = int(np.argmax(seed_distances))
+
+        landmarks = []
+        distances = np.empty((2, num_landmarks, n), dtype=np.float64)
+        closest = np.full(n, np.inf)
+
+        for k in range(num_landmarks):
+            landmarks.append(landmark)
+            distances[0, k] = shortest_path_distances(graph, landmark)
+            distances[1, k] = shortest_path_distances(reverse_graph, landmark)
+
+            # Next landmark: the node farthest from all landmarks chosen so far
+            closest = np.minimum(closest, distances[0, k])
+            closest[landmarks] = -1
+            landmark = int(np.argmax(closest))
+
+        return cls(landmarks, distances)
+
+    def save(self, path):
+        """Save the landmark tables to an .npz file"""
+        np.savez(path, landmarks=self.landmarks, distances=self.distances)
+
+    @classmethod
+    def load(cls, path):
+        """Load landmark tables written by save()"""
+        with np.load(path) as data:
+            return cls(data["landmarks"], data["distances"])
+
+    def reverse(self):
+        """
+        Landmark tables for the reversed graph
+
+        reverse().for_query(goal, start) gives lower bounds on the distance
+        from the start to each node, as used by the backward half of
+        bidirectional_a_star.
+        """
+        return LandmarkHeuristic(self.landmarks, self.distances[::-1])
+
+    def costs(self, goal):
+        """
+        Heuristic costs from every node to the goal
+
+        Args:
+            goal: Index of the goal node
+
+        Returns:
+            Array of length n with an admissible estimate per node
+        """
+        from_landmark, to_landmark = self.distances
+
+        # fmax ignores the nan of inf - inf, which gives no information about the pair
+        with np.errstate(invalid="ignore"):
+            bounds = np.fmax(from_landmark[:, [goal]] - from_landmark,
+                             to_landmark - to_landmark[:, [goal]])
+
+        best = np.fmax.reduce(bounds, axis=0)
+        best[np.isnan(best)] = 0
+        return np.maximum(best, 0)
+
+    def for_query(self, start, goal, active=None):
+        """
+        Heuristic for one (start, goal) query, evaluated lazily per node
+
+        Args:
+            start: Index of the start node
+            goal: Index of the goal node
+            active: If given, only the `active` landmarks with the tightest
+                    bound at the start node are used
+
+        Returns:
+            Object that can be indexed like the heuristic_costs list of a_star_search
+        """
+        landmarks = None
+        if active is not None and active < len(self.landmarks):
+            with np.errstate(invalid="ignore"):
+                per_landmark = np.nan_to_num(np.fmax(
+                    self.distances[0, :, goal] - self.distances[0, :, start],
+                    self.distances[1, :, start] - self.distances[1, :, goal],
+                ), nan=0)
+            landmarks = np.argsort(-per_landmark)[:active]
+
+        return _QueryHeuristic(self, goal, landmarks)
+
+class _QueryHeuristic:
+    """
+    Lazy heuristic_costs sequence that computes the ALT bound on access
+
+    Only the goal's column of the landmark tables is read up front; a
+    node's column is read (and its bound cached) the first time the
+    search asks for it.
+    """
+    def __init__(self, heuristic, goal, landmarks):
+        self.distances = heuristic.distances
+        self.landmarks = slice(None) if landmarks is None else np.asarray(landmarks)
+        self.from_goal = self.distances[0, self.landmarks, goal].tolist()
+        self.to_goal = self.distances[1, self.landmarks, goal].tolist()
+        self.bounds = {}
+
+    def __len__(self):
+        return self.distances.shape[2]
+
+    def __getitem__(self, node):
+        best = self.bounds.get(node)
+        if best is not None:
+            return best
+
+        from_landmark, to_landmark = self.distances[:, self.landmarks, node].tolist()
+        best = 0
+        for from_goal, from_node, to_node, to_goal in zip(
+            self.from_goal, from_landmark, to_landmark, self.to_goal
+        ):
+            # Comparisons with nan (inf - inf) are False, so uninformative bounds are ignored
+            for bound in (from_goal - from_node, to_node - to_goal):
+                if bound > best:
+                    best = bound
+        self.bounds[node] = best
+        return best
+
+def main():
+    """Answer a few queries with A* and an ALT landmark heuristic"""
+    from .a_star import a_star_search_with_stats
+
+    # Same 7 node graph as the A* example
+    inf = float('inf')
+    graph = [
+        #0    1    2    3    4    5    6
+        [0,   2,   4,   inf, inf, inf, inf], # 0
+        [2,   0,   1,   7,   inf, inf, inf], # 1
+        [4,   1,   0,   inf, 3,   inf, inf], # 2
+        [inf, 7,   inf, 0,   2,   1,   inf], # 3
+        [inf, inf, 3,   2,   0,   5,   2],   # 4
+        [inf, inf, inf, 1,   5,   0,   3],   # 5
+        [inf, inf, inf, inf, 2,   3,   0]    # 6
+    ]
+
+    heuristic = LandmarkHeuristic.build(graph, num_landmarks=2, seed=0)
+    print(f"Landmarks: {heuristic.landmarks.tolist()}")
+
+    # Any (start, goal) pair can now be answered without a hand-written heuristic
+    for start_node, goal_node in [(0, 6), (6, 0), (1, 5)]:
+        h = heuristic.for_query(start_node, goal_node)
+        path, cost, stats = a_star_search_with_stats(graph, start_node, goal_node, h)
+        print(f"{start_node} -> {goal_node}: path {path}, cost {cost}, expanded {stats['expanded']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,707 @@
+import multiprocessing
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+def get_children(node_index, game_tree, branching_factor=2):
+    """
+    Child positions of a node in the matrix game tree
+
+    Node (i, j) has children (i + 1, j * b) ... (i + 1, j * b + b - 1) for
+    branching factor b, where they exist.
+    """
+    i, j = node_index
+    
+    # Find child indices (in the next row), keeping only those within bounds
+    first = j * branching_factor
+    last = min(first + branching_factor, len(game_tree[i+1]))
+    return [(i + 1, child) for child in range(first, last)]
+
+def minimax(node_index, depth, is_maximizing, game_tree, branching_factor=2):
+    """
+    Minimax algorithm with DFS on a game tree represented as a matrix
+    
+    Parameters:
+    - node_index: Current position (i,j) in the game tree matrix
+    - depth: Current depth in the tree
+    - is_maximizing: Boolean indicating if current player is maximizing
+    - game_tree: Matrix representation of the game tree
+    - branching_factor: Number of children per internal node
+    
+    Returns:
+    - best_value: The optimal value for the current player
+    """
+    i, j = node_index
+    
+    # Base case: If leaf node (last row of the matrix)
+    if i == len(game_tree) - 1:
+        return game_tree[i][j]
+    
+    children = get_children(node_index, game_tree, branching_factor)
+    
+    if is_maximizing:
+        best_value = float('-inf')
+        for child in children:
+            value = minimax(child, depth + 1, False, game_tree, branching_factor)
+            best_value = max(best_value, value)
+            print(f"MAX node {node_index} evaluating child {child}: value={value}, best={best_value}")
+        return best_value
+    else:
+        best_value = float('inf')
+        for child in children:
+            value = minimax(child, depth + 1, True, game_tree, branching_factor)
+            best_value = min(best_value, value)
+            print(f"MIN node {node_index} evaluating child {child}: value={value}, best={best_value}")
+        return best_value
+
+class SearchBudgetExceeded(Exception):
+    """Raised by AlphaBeta.search when the deadline or node budget runs out"""
+
+# Bound types stored with transposition table values
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+class TranspositionTable:
+    """
+    Transposition table with a size bound and least-recently-used eviction
+
+    Entries map a node key to (draft, value, flag, best_move), where draft is
+    the number of levels searched below the node and flag says whether value
+    is exact or only a lower/upper bound (because of an alpha-beta cutoff).
+
+    Parameters:
+    - max_size: Maximum number of entries kept
+    """
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, draft, value, flag, best_move):
+        self.entries[key] = (draft, value, flag, best_move)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+class Game(ABC):
+    """
+    Game protocol for searching states lazily instead of a materialized tree
+
+    Subclasses describe a game by its rules; the search engines only ever
+    hold the states on the current line of play, so memory grows with the
+    search depth rather than with the size of the tree. A subclass that
+    misses one of the abstract methods can't be instantiated.
+    """
+    @abstractmethod
+    def initial_state(self):
+        """State at the root of the search"""
+
+    @abstractmethod
+    def children(self, state):
+        """Iterable (e.g. a generator) of the states reachable in one move"""
+
+    @abstractmethod
+    def is_terminal(self, state):
+        """Whether the game is over in this state"""
+
+    @abstractmethod
+    def evaluate(self, state):
+        """Exact value of a terminal state, or a heuristic estimate of any other state"""
+
+    def key(self, state, is_maximizing):
+        """
+        Hashable key identifying the position, used by the transposition table
+
+        The same state with the other side to move is a different position,
+        so the default key is the pair of both.
+        """
+        return state, is_maximizing
+
+class MatrixGame(Game):
+    """
+    Adapter that exposes the matrix game tree format through the Game protocol
+
+    States are (i, j) node positions, as used by minimax.
+
+    Parameters:
+    - game_tree: Matrix representation of the game tree
+    - branching_factor: Number of children per internal node
+    - heuristic: Optional estimate heuristic(node_index) for internal nodes
+    """
+    def __init__(self, game_tree, branching_factor=2, heuristic=None):
+        self.game_tree = game_tree
+        self.branching_factor = branching_factor
+        self.heuristic = heuristic
+
+    def initial_state(self):
+        return (0, 0)
+
+    def children(self, state):
+        return get_children(state, self.game_tree, self.branching_factor)
+
+    def is_terminal(self, state):
+        return state[0] == len(self.game_tree) - 1
+
+    def evaluate(self, state):
+        i, j = state
+        if i == len(self.game_tree) - 1:
+            return self.game_tree[i][j]
+        if self.heuristic is None:
+            raise ValueError("Internal nodes of a matrix game tree need a heuristic to be evaluated")
+        return self.heuristic(state)
+
+def as_game(game, branching_factor=2, heuristic=None):
+    """Return game unchanged if it is a Game, otherwise wrap the matrix game tree"""
+    if isinstance(game, Game):
+        return game
+    return MatrixGame(game, branching_factor, heuristic)
+
+def game_minimax(game, state=None, is_maximizing=True, draft=None):
+    """
+    Plain minimax over a Game, expanding states lazily
+
+    Parameters:
+    - game: Game (or matrix game tree)
+    - state: State to search from (defaults to the initial state)
+    - is_maximizing: Boolean indicating if the player to move is maximizing
+    - draft: Number of moves to look ahead before falling back to
+      game.evaluate; None searches to terminal states
+
+    Returns:
+    - best_value: The minimax value of the state
+    """
+    game = as_game(game)
+    if state is None:
+        state = game.initial_state()
+
+    if game.is_terminal(state) or draft == 0:
+        return game.evaluate(state)
+
+    next_draft = None if draft is None else draft - 1
+    values = (game_minimax(game, child, not is_maximizing, next_draft) for child in game.children(state))
+    if is_maximizing:
+        return max(values, default=float('-inf'))
+    return min(values, default=float('inf'))
+
+class AlphaBeta:
+    """
+    Minimax with alpha-beta pruning over a Game or the matrix game tree
+
+    Parameters:
+    - game: Game, or a matrix game tree (wrapped in MatrixGame)
+    - move_ordering: None (tree order), "static" (sort children by evaluate),
+      "killer" (try the move that last caused a cutoff at this ply first)
+      or "history" (sort moves by how often they caused cutoffs)
+    - evaluate: Cheap static evaluation evaluate(state). For a matrix game tree
+      it also scores internal nodes at a depth cutoff; a Game uses game.evaluate
+    - table: Optional TranspositionTable, keyed by game.key(state, is_maximizing)
+    - branching_factor: Number of children per internal node of a matrix game tree
+    """
+    def __init__(self, game, move_ordering=None, evaluate=None, table=None,
+                 branching_factor=2):
+        if move_ordering not in (None, "static", "killer", "history"):
+            raise ValueError(f"Unknown move ordering: {move_ordering}")
+
+        self.game = as_game(game, branching_factor, evaluate)
+        if evaluate is None and isinstance(game, Game):
+            evaluate = game.evaluate
+        if move_ordering == "static" and evaluate is None:
+            raise ValueError("Static move ordering needs an evaluate function")
+
+        self.move_ordering = move_ordering
+        self.evaluate = evaluate
+        self.table = table
+        self.killers = {}
+        self.history = {}
+        self.stats = {"nodes_evaluated": 0, "nodes_pruned": 0}
+
+        # Set when a search stopped at its draft rather than at terminal states
+        self.cutoff_reached = False
+
+        # Optional search budget, checked while searching
+        self.deadline = None
+        self.max_nodes = None
+
+    def order_moves(self, ply, children, is_maximizing, hint):
+        """Return child positions (0..b-1) in the order they should be searched"""
+        moves = list(range(len(children)))
+
+        if self.move_ordering == "static":
+            scores = [self.evaluate(child) for child in children]
+            moves.sort(key=lambda move: scores[move], reverse=is_maximizing)
+        elif self.move_ordering == "history":
+            moves.sort(key=lambda move: self.history.get((ply, move), 0), reverse=True)
+        elif self.move_ordering == "killer":
+            killer = self.killers.get(ply)
+            if killer in moves:
+                moves.remove(killer)
+                moves.insert(0, killer)
+
+        # The best move stored in the transposition table goes first
+        if hint is not None and hint in moves:
+            moves.remove(hint)
+            moves.insert(0, hint)
+        return moves
+
+    def check_budget(self):
+        """Raise SearchBudgetExceeded once the node budget or deadline is used up"""
+        nodes = self.stats["nodes_evaluated"]
+        if self.max_nodes is not None and nodes > self.max_nodes:
+            raise SearchBudgetExceeded
+        # Reading the clock on every node would cost more than the node itself
+        if self.deadline is not None and nodes % 64 == 0 and time.perf_counter() > self.deadline:
+            raise SearchBudgetExceeded
+
+    def search(self, state, is_maximizing, alpha=float('-inf'), beta=float('inf'), draft=None, ply=0):
+        """
+        Alpha-beta search below a state
+
+        Parameters:
+        - draft: Number of moves to search below the state; states at the
+          cutoff are scored with game.evaluate. None searches to terminal states.
+        - ply: Distance from the root, used by killer and history ordering
+
+        Returns:
+        - best_value: The same value minimax returns for this state (with a
+          draft, the depth-limited estimate)
+        """
+        self.stats["nodes_evaluated"] += 1
+        if self.deadline is not None or self.max_nodes is not None:
+            self.check_budget()
+
+        # Base case: game over
+        if self.game.is_terminal(state):
+            return self.game.evaluate(state)
+
+        # Depth cutoff: fall back to the heuristic evaluation
+        if draft == 0:
+            self.cutoff_reached = True
+            return self.game.evaluate(state)
+
+        # A search to terminal states (draft None) is valid for any draft
+        stored_draft = float('inf') if draft is None else draft
+        original_alpha, original_beta = alpha, beta
+        hint = None
+
+        # Reuse a stored result if it was searched at least this deep
+        if self.table is not None:
+            key = self.game.key(state, is_maximizing)
+            entry = self.table.get(key)
+            if entry is not None:
+                entry_draft, value, flag, hint = entry
+                if entry_draft >= stored_draft:
+                    # A depth-limited entry may hide a cutoff further down
+                    if entry_draft != float('inf'):
+                        self.cutoff_reached = True
+                    if flag == EXACT:
+                        return value
+                    if flag == LOWER_BOUND:
+                        alpha = max(alpha, value)
+                    else:
+                        beta = min(beta, value)
+                    if alpha >= beta:
+                        return value
+
+        # Track cutoffs in this subtree separately from the rest of the search
+        outer_cutoff_reached = self.cutoff_reached
+        self.cutoff_reached = False
+
+        # Only the children of states on the current line are held in memory
+        children = list(self.game.children(state))
+        moves = self.order_moves(ply, children, is_maximizing, hint)
+        next_draft = None if draft is None else draft - 1
+
+        best_value = float('-inf') if is_maximizing else float('inf')
+        best_move = None
+        for position, move in enumerate(moves):
+            value = self.search(children[move], not is_maximizing, alpha, beta, next_draft, ply + 1)
+
+            if is_maximizing:
+                if best_move is None or value > best_value:
+                    best_value, best_move = value, move
+                alpha = max(alpha, best_value)
+            else:
+                if best_move is None or value < best_value:
+                    best_value, best_move = value, move
+                beta = min(beta, best_value)
+
+            # Cutoff: the opponent will never let the game reach this node
+            if alpha >= beta:
+                self.stats["nodes_pruned"] += len(moves) - position - 1
+                self.killers[ply] = move
+                self.history[(ply, move)] = self.history.get((ply, move), 0) + 2 ** min(stored_draft, 32)
+                break
+
+        # A subtree searched down to terminal states only is valid for any draft
+        if not self.cutoff_reached:
+            stored_draft = float('inf')
+        self.cutoff_reached = self.cutoff_reached or outer_cutoff_reached
+
+        if self.table is not None:
+            if best_value <= original_alpha:
+                flag = UPPER_BOUND
+            elif best_value >= original_beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.table.store(key, stored_draft, best_value, flag, best_move)
+
+        return best_value
+
+def alpha_beta_search(game_tree, is_maximizing=True, move_ordering=None, evaluate=None,
+                      table_size=None, branching_factor=2):
+    """
+    Alpha-beta search from the root of a Game or the matrix game tree
+
+    Parameters:
+    - game_tree: Game, or matrix representation of the game tree
+    - is_maximizing: Boolean indicating if the root player is maximizing
+    - move_ordering: None, "static", "killer" or "history" (see AlphaBeta)
+    - evaluate: Static evaluation used by "static" move ordering
+    - table_size: If given, use a transposition table with this many entries
+    - branching_factor: Number of children per internal node
+
+    Returns:
+    - best_value: The same value as minimax((0, 0), 0, is_maximizing, game_tree)
+    - stats: Dictionary with "nodes_evaluated", "nodes_pruned" and, with a
+      transposition table, "table_hits"
+    """
+    table = TranspositionTable(table_size) if table_size else None
+    engine = AlphaBeta(game_tree, move_ordering, evaluate, table, branching_factor)
+    best_value = engine.search(engine.game.initial_state(), is_maximizing)
+
+    stats = dict(engine.stats)
+    if table is not None:
+        stats["table_hits"] = table.hits
+    return best_value, stats
+
+def iterative_deepening_search(game_tree, evaluate=None, is_maximizing=True, time_limit=None,
+                               max_nodes=None, max_depth=None, move_ordering=None,
+                               table_size=100000, branching_factor=2):
+    """
+    Anytime alpha-beta search that deepens one level at a time until the budget runs out
+
+    Each iteration is a depth-limited alpha-beta search that scores states at
+    the cutoff with the heuristic evaluation. The best root move of the
+    previous iteration is searched first, and the transposition table
+    carries best moves from shallower iterations into the ordering of
+    deeper ones. Deepening stops by itself once an iteration reaches only
+    terminal states.
+
+    Parameters:
+    - game_tree: Game, or matrix representation of the game tree
+    - evaluate: Heuristic evaluation evaluate(node_index) for internal nodes
+      of a matrix game tree (a Game uses game.evaluate)
+    - is_maximizing: Boolean indicating if the root player is maximizing
+    - time_limit: Wall-clock budget in seconds
+    - max_nodes: Budget on the total number of nodes evaluated
+    - max_depth: Deepest iteration to run (defaults to no limit)
+    - move_ordering: None, "static", "killer" or "history" (see AlphaBeta)
+    - table_size: Size of the transposition table shared by all iterations
+    - branching_factor: Number of children per internal node
+
+    Returns:
+    - best_move: Best root child state found, e.g. position (1, j) in a matrix game tree
+      (None if the root is terminal)
+    - best_value: Its value from the deepest completed iteration
+    - stats: Dictionary with "depth_reached", "nodes_evaluated", "nodes_pruned"
+      and "budget_exceeded"
+    """
+    table = TranspositionTable(table_size) if table_size else None
+    engine = AlphaBeta(game_tree, move_ordering, evaluate, table, branching_factor)
+    if time_limit is not None:
+        engine.deadline = time.perf_counter() + time_limit
+    engine.max_nodes = max_nodes
+    game = engine.game
+
+    root = game.initial_state()
+    if game.is_terminal(root):
+        # The root is already terminal, so there is no move to choose
+        stats = dict(engine.stats, depth_reached=0, budget_exceeded=False)
+        return None, game.evaluate(root), stats
+
+    children = list(game.children(root))
+
+    # Fallback if not even the first iteration finishes: best child by static evaluation
+    scores = [game.evaluate(child) for child in children]
+    best_move = (max if is_maximizing else min)(range(len(children)), key=lambda move: scores[move])
+    best_value = scores[best_move]
+    depth_reached = 0
+    budget_exceeded = False
+
+    depth = 1
+    while max_depth is None or depth <= max_depth:
+        iteration_value = float('-inf') if is_maximizing else float('inf')
+        iteration_move = None
+        engine.cutoff_reached = False
+
+        try:
+            # Previous best move first, the rest by the engine's ordering
+            alpha, beta = float('-inf'), float('inf')
+            for move in engine.order_moves(0, children, is_maximizing, best_move):
+                value = engine.search(children[move], not is_maximizing, alpha, beta, depth - 1, 1)
+                if is_maximizing and (iteration_move is None or value > iteration_value):
+                    iteration_value, iteration_move = value, move
+                    alpha = max(alpha, value)
+                elif not is_maximizing and (iteration_move is None or value < iteration_value):
+                    iteration_value, iteration_move = value, move
+                    beta = min(beta, value)
+        except SearchBudgetExceeded:
+            budget_exceeded = True
+            break
+
+        # Only a completed iteration replaces the answer
+        best_move, best_value = iteration_move, iteration_value
+        depth_reached = depth
+
+        # Nothing was cut off, so a deeper iteration would give the same result
+        if not engine.cutoff_reached:
+            break
+        depth += 1
+
+    stats = dict(engine.stats)
+    stats["depth_reached"] = depth_reached
+    stats["budget_exceeded"] = budget_exceeded
+    return children[best_move], best_value, stats
+
+def vectorized_minimax(leaves, branching_factor=2, num_levels=None, is_maximizing=True):
+    """
+    Bottom-up minimax over a complete game tree, one whole level at a time
+
+    The leaf level of a complete tree with branching factor b is reshaped to
+    (-1, b) and reduced with max or min along axis 1, which gives the level
+    above; repeating this up to the root replaces one function call per
+    node with one NumPy reduction per level.
+
+    Parameters:
+    - leaves: Leaf values (the last row of game_tree), a NumPy array, or the
+      path of a .npy file, which is memory-mapped instead of loaded
+    - branching_factor: Number of children per internal node (at least 2)
+    - num_levels: Number of levels above the leaves (len(game_tree) - 1).
+      Defaults to log_b(len(leaves)); with a value given, only the first
+      b ** num_levels leaves are reachable, as in minimax
+    - is_maximizing: Boolean indicating if the root player is maximizing
+
+    Returns:
+    - best_value: The minimax value of the root
+    - best_moves: Child index (0..b-1) chosen at each level along the principal variation
+    """
+    if branching_factor < 2:
+        raise ValueError(f"branching_factor must be at least 2, got {branching_factor}")
+    if isinstance(leaves, (str, os.PathLike)):
+        leaves = np.load(leaves, mmap_mode="r")
+    leaves = np.asarray(leaves)
+
+    if num_levels is None:
+        num_levels = 0
+        while branching_factor ** num_levels < len(leaves):
+            num_levels += 1
+        if branching_factor ** num_levels != len(leaves):
+            raise ValueError(f"{len(leaves)} leaves is not a power of the branching factor {branching_factor}")
+    num_leaves = branching_factor ** num_levels
+    if len(leaves) < num_leaves:
+        raise ValueError(f"Expected {num_leaves} leaves for a complete tree, got {len(leaves)}")
+    leaves = leaves[:num_leaves]
+
+    # levels[i] holds the values of every node at depth i; the leaves stay memory-mapped
+    levels = [leaves]
+    for depth in range(num_levels - 1, -1, -1):
+        maximizing = is_maximizing == (depth % 2 == 0)
+        children = levels[0].reshape(-1, branching_factor)
+        levels.insert(0, children.max(axis=1) if maximizing else children.min(axis=1))
+
+    # Walk down from the root, following the best child at each level
+    best_moves = []
+    node = 0
+    for depth in range(num_levels):
+        maximizing = is_maximizing == (depth % 2 == 0)
+        children = levels[depth + 1][node * branching_factor:(node + 1) * branching_factor]
+        move = int(np.argmax(children) if maximizing else np.argmin(children))
+        best_moves.append(move)
+        node = node * branching_factor + move
+
+    return levels[0][0].item(), best_moves
+
+# Per-process state for parallel minimax workers, set once by _init_minimax_worker
+_worker_state = {}
+
+def _init_minimax_worker(shm_name, shape, dtype, row_lengths, branching_factor, move_ordering, bound):
+    # Attach to the shared leaf array; internal rows are only needed for their length
+    shm = shared_memory.SharedMemory(name=shm_name)
+    leaves = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    game_tree = [range(length) for length in row_lengths] + [leaves]
+    _worker_state.update(shm=shm, game_tree=game_tree, branching_factor=branching_factor,
+                         move_ordering=move_ordering, bound=bound)
+
+def _search_split_node(node_index, is_maximizing, root_maximizing):
+    """Alpha-beta search of one subtree, using the shared root bound as its window"""
+    engine = AlphaBeta(_worker_state["game_tree"], _worker_state["move_ordering"],
+                       branching_factor=_worker_state["branching_factor"])
+
+    # Values that can't beat the best root move so far only need an upper (lower) bound
+    bound = _worker_state["bound"].value
+    if root_maximizing:
+        value = engine.search(node_index, is_maximizing, alpha=bound)
+    else:
+        value = engine.search(node_index, is_maximizing, beta=bound)
+
+    if isinstance(value, np.generic):
+        value = value.item()
+    return node_index, value, engine.stats["nodes_evaluated"]
+
+def _combine(node_index, is_maximizing, split_depth, values, game_tree, branching_factor):
+    """Minimax over the levels above split_depth, given the values of the split nodes"""
+    if node_index[0] == split_depth:
+        return values[node_index]
+    children = [
+        _combine(child, not is_maximizing, split_depth, values, game_tree, branching_factor)
+        for child in get_children(node_index, game_tree, branching_factor)
+    ]
+    if is_maximizing:
+        return max(children, default=float('-inf'))
+    return min(children, default=float('inf'))
+
+def parallel_minimax(game_tree, is_maximizing=True, branching_factor=2, split_depth=1,
+                     workers=None, move_ordering=None):
+    """
+    Root-parallel alpha-beta over the matrix game tree using a process pool
+
+    The leaf row is copied once into shared memory and every worker attaches
+    to it when it starts, so tasks only carry a node position. Each node at
+    split_depth is searched by a worker, and the levels above are combined
+    with max/min. The best root value found so far is kept in a shared
+    value: workers search with it as their alpha (beta for a minimizing
+    root), so subtrees that can't improve on it are still pruned.
+
+    Parameters:
+    - game_tree: Matrix representation of the game tree
+    - is_maximizing: Boolean indicating if the root player is maximizing
+    - branching_factor: Number of children per internal node
+    - split_depth: Level of the nodes handed to workers (1 = root children).
+      A tree with fewer levels is searched serially
+    - workers: Number of worker processes (defaults to the CPU count)
+    - move_ordering: Move ordering used by each worker (see AlphaBeta)
+
+    Returns:
+    - best_value: The same value as minimax((0, 0), 0, is_maximizing, game_tree)
+    - stats: Dictionary with "nodes_evaluated" and "tasks"
+    """
+    height = len(game_tree) - 1
+    split_depth = max(1, split_depth)
+    if height < split_depth:
+        # Nothing to hand out at that level, the whole tree is one serial search
+        best_value, stats = alpha_beta_search(game_tree, is_maximizing, move_ordering,
+                                              branching_factor=branching_factor)
+        return best_value, {"nodes_evaluated": stats["nodes_evaluated"], "tasks": 0}
+
+    # Only numeric leaves can go through shared memory, so check them here, not in a worker
+    leaves = np.asarray(game_tree[-1])
+    if leaves.dtype.kind not in "biuf":
+        try:
+            leaves = np.asarray(game_tree[-1], dtype=float)
+        except (TypeError, ValueError):
+            leaves = None
+        if leaves is None or np.isnan(leaves).any():
+            raise ValueError("parallel_minimax needs numeric leaf values")
+    row_lengths = [len(row) for row in game_tree[:-1]]
+
+    # Nodes at split_depth that are reachable from the root, in tree order
+    split_nodes = [(0, 0)]
+    for _ in range(split_depth):
+        split_nodes = [child for node in split_nodes for child in get_children(node, game_tree, branching_factor)]
+    split_maximizing = is_maximizing == (split_depth % 2 == 0)
+
+    # Tasks below each root child, so its value is known as soon as they are done
+    per_root_child = {}
+    for node in split_nodes:
+        root_child = (1, node[1] // branching_factor ** (split_depth - 1))
+        per_root_child.setdefault(root_child, []).append(node)
+
+    context = multiprocessing.get_context()
+    bound = context.Value('d', float('-inf') if is_maximizing else float('inf'))
+    shm = shared_memory.SharedMemory(create=True, size=max(leaves.nbytes, 1))
+    try:
+        np.ndarray(leaves.shape, dtype=leaves.dtype, buffer=shm.buf)[:] = leaves
+
+        values = {}
+        nodes_evaluated = 0
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_minimax_worker,
+            initargs=(shm.name, leaves.shape, leaves.dtype, row_lengths, branching_factor,
+                      move_ordering, bound)
+        ) as pool:
+            futures = [
+                pool.submit(_search_split_node, node, split_maximizing, is_maximizing)
+                for node in split_nodes
+            ]
+            for future in as_completed(futures):
+                node, value, nodes = future.result()
+                values[node] = value
+                nodes_evaluated += nodes
+
+                # A finished root child tightens the bound for tasks that start later
+                root_child = (1, node[1] // branching_factor ** (split_depth - 1))
+                if all(task in values for task in per_root_child[root_child]):
+                    child_value = _combine(root_child, not is_maximizing, split_depth, values,
+                                           game_tree, branching_factor)
+                    with bound.get_lock():
+                        if is_maximizing:
+                            bound.value = max(bound.value, child_value)
+                        else:
+                            bound.value = min(bound.value, child_value)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    best_value = _combine((0, 0), is_maximizing, split_depth, values, game_tree, branching_factor)
+    return best_value, {"nodes_evaluated": nodes_evaluated, "tasks": len(split_nodes)}
+
+def main():
+    """Run the minimax examples on the small game tree"""
+    # Define the game tree as a matrix
+    # Each row represents a level in the tree
+    # Only leaf nodes have actual values, internal nodes have None
+    game_tree = [
+        [None],             # Root (MAX) - Level 0
+        [None, None, None], # Level 1 (MIN)
+        [3, 5, 2, 9, 12, 8] # Level 2 (leaf nodes)
+    ]
+
+    print("Game Tree Matrix:")
+    for i, level in enumerate(game_tree):
+        print(f"Level {i}: {level}")
+
+    # Run the minimax algorithm starting at the root (0,0)
+    print("\nRunning Minimax with DFS:")
+    optimal_value = minimax((0, 0), 0, True, game_tree)
+    print(f"\nOptimal value for the root node: {optimal_value}")
+
+    # Visualize the game tree (text representation)
+    print("\nGame Tree Visualization:")
+    print("       MAX       ")
+    print("        |        ")
+    print("    MIN     MIN  ")
+    print("    / \\     / \\ ")
+    print("   3   5   2   9 ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,608 @@
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import random
+
+from .distance_providers import as_distances, attach_distances, shared_distances
+from .streaming import stop_early
+
+def calculate_total_distance(route, distances):
+    """Calculate the total distance of a route"""
+    total = 0
+    for i in range(len(route) - 1):
+        total += distances[route[i], route[i + 1]]
+    return total
+
+def generate_neighbors(route):
+    """Generate all neighbors by swapping pairs of cities (excluding first and last)"""
+    neighbors = []
+    # We don't swap the first and last cities (fixed as 0)
+    for i in range(1, len(route) - 1):
+        for j in range(i + 1, len(route) - 1):
+            # Create a new neighbor by swapping cities at positions i and j
+            neighbor = route.copy()
+            neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+            neighbors.append(neighbor)
+    return neighbors
+
+def swap_deltas(route, distances):
+    """
+    Change in total distance for every pairwise swap, computed at once with NumPy
+
+    Swapping the cities at positions i < j only changes the (up to) four
+    edges around them, so each delta is O(1) and all of them come from a few
+    fancy-indexing operations on distances without building any neighbor
+    route. Works for asymmetric distances too.
+
+    Returns:
+        Matrix where entry [i-1, j-1] is the delta of swapping positions i and j
+        (inf where i >= j)
+    """
+    route = np.asarray(route)
+    cities = route[1:-1]
+    before, after = route[:-2], route[2:]
+
+    # Edges around each city today: a vector, since it only depends on one position
+    removed = distances[before, cities] + distances[cities, after]
+
+    # General case (cities not next to each other): city j moves between i's
+    # neighbors and city i between j's neighbors
+    into = distances[np.ix_(before, cities)]  # into[i, j] = distances[route[i], route[j + 1]]
+    out_of = distances[np.ix_(cities, after)]  # out_of[i, j] = distances[route[i + 1], route[j + 2]]
+    added = into + out_of.T + into.T + out_of
+    deltas = (added - removed[:, None] - removed[None, :]).astype(np.float64)
+
+    # Adjacent cities (j == i + 1) share an edge, which just changes direction
+    a, b = cities[:-1], cities[1:]
+    old = distances[before[:-1], a] + distances[a, b] + distances[b, after[1:]]
+    new = distances[before[:-1], b] + distances[b, a] + distances[a, after[1:]]
+    rows = np.arange(len(cities) - 1)
+    deltas[rows, rows + 1] = new - old
+
+    # Each pair only once
+    deltas[np.tril_indices(len(cities))] = np.inf
+    return deltas
+
+def nearest_neighbors(distances, k, chunk_size=1024):
+    """
+    Candidate lists: the k nearest other cities of every city, closest first
+
+    Computed once, in row chunks so the temporary arrays stay small (a few
+    million distances at a time, however large the instance).
+    """
+    distances = as_distances(distances)
+    num_cities = distances.shape[0]
+    k = min(k, num_cities - 1)
+    chunk_size = max(1, min(chunk_size, (1 << 22) // max(num_cities, 1)))
+    candidates = np.empty((num_cities, k), dtype=np.int64)
+
+    for start in range(0, num_cities, chunk_size):
+        rows = np.arange(start, min(start + chunk_size, num_cities))
+        block = np.array(distances[rows], dtype=np.float64)
+        block[rows - start, rows] = np.inf  # a city is not its own neighbor
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k] if k > 0 else np.empty((len(rows), 0), dtype=np.int64)
+        order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+        candidates[rows] = np.take_along_axis(nearest, order, axis=1)
+
+    return candidates
+
+def _reverse(tour, pos, i, j):
+    """Reverse the tour between positions i and j (inclusive, wrapping around)"""
+    n = len(tour)
+    length = (j - i) % n + 1
+
+    # Reversing the complement gives the same cycle, so reverse the shorter side
+    if 2 * length > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        length = n - length
+
+    for _ in range(length // 2):
+        a, b = tour[i], tour[j]
+        tour[i], pos[b] = b, i
+        tour[j], pos[a] = a, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+def _two_opt_move(tour, pos, a, b, c, d):
+    """
+    Replace edges (a, b) and (c, d) by (a, c) and (b, d)
+
+    b and d must both be the successors (or both the predecessors) of a and c.
+    """
+    if tour[(pos[a] + 1) % len(tour)] == b:
+        _reverse(tour, pos, pos[b], pos[c])
+    else:
+        _reverse(tour, pos, pos[a], pos[d])
+
+def local_search_stream(distances, route, moves=("2-opt", "or-opt"), k=8, max_segment=3,
+                        time_limit=None, candidates=None, report_every=None):
+    """
+    local_search as a generator of progress records
+
+    Args:
+        report_every: Yield a record after every this many applied moves
+                      (None yields only the final record)
+        (the other arguments are the same as for local_search)
+
+    Yields:
+        Dictionary with "moves" (applied so far), "best_distance" and "route"
+        (the current route, beginning and ending at city 0), "improvement",
+        "elapsed", "improvement_per_second" and "local_optimum" (True once no
+        candidate move improves the route). The last record describes the
+        result; it is a local optimum unless time_limit ran out.
+    """
+    start_time = time.perf_counter()
+    distances = as_distances(distances)
+    dist = distances.item
+    tour = list(route[:-1])
+    n = len(tour)
+    pos = [0] * n
+    for index, city in enumerate(tour):
+        pos[city] = index
+
+    def succ(city):
+        return tour[(pos[city] + 1) % n]
+
+    def pred(city):
+        return tour[pos[city] - 1]
+
+    if candidates is None:
+        candidates = nearest_neighbors(distances, k)
+    candidates = np.asarray(candidates).tolist()
+    initial_distance = calculate_total_distance(route, distances)
+
+    def improve_two_opt(a):
+        # Try both tour directions: new edges (a, c) and (b, d)
+        for step in (succ, pred):
+            b = step(a)
+            removed = dist(a, b)
+            for c in candidates[a]:
+                added = dist(a, c)
+                if added >= removed:
+                    break  # candidates are sorted, no later one can help
+                d = step(c)
+                if c == b or d == a:
+                    continue
+                delta = added + dist(b, d) - removed - dist(c, d)
+                if delta < -1e-9:
+                    _two_opt_move(tour, pos, a, b, c, d)
+                    return (a, b, c, d)
+        return None
+
+    def improve_or_opt(a):
+        # Move the segment starting at a to between two cities elsewhere
+        first = a
+        last = a
+        for length in range(1, max_segment + 1):
+            if length > 1:
+                last = succ(last)
+            if n < length + 3:
+                break
+            before, after = pred(first), succ(last)
+            segment = set()
+            city = first
+            for _ in range(length):
+                segment.add(city)
+                city = succ(city)
+            removed = dist(before, first) + dist(last, after) - dist(before, after)
+
+            for end in (first, last):
+                for c in candidates[end]:
+                    if dist(end, c) >= removed:
+                        break
+                    if c in segment:
+                        continue
+                    # Insertion edges (c, succ(c)) and (pred(c), c)
+                    for x, y in ((c, succ(c)), (pred(c), c)):
+                        if x in segment or y in segment:
+                            continue
+                        base = dist(x, y)
+                        forward = dist(x, first) + dist(last, y) - base - removed
+                        backward = dist(x, last) + dist(first, y) - base - removed
+                        if min(forward, backward) < -1e-9:
+                            # Segment move as 2-opt moves: p S M y -> p M S^r y (-> p M S y)
+                            _two_opt_move(tour, pos, before, first, x, y)
+                            _two_opt_move(tour, pos, before, x, after, last)
+                            if forward < backward and length > 1:
+                                _two_opt_move(tour, pos, x, last, first, y)
+                            return (before, first, last, after, x, y)
+        return None
+
+    def record(local_optimum):
+        # Rotate so the route starts and ends at city 0 again
+        zero = pos[0]
+        new_route = tour[zero:] + tour[:zero] + [0]
+        distance = calculate_total_distance(new_route, distances)
+        elapsed = time.perf_counter() - start_time
+        improvement = initial_distance - distance
+        return {
+            "moves": applied,
+            "best_distance": distance,
+            "route": new_route,
+            "improvement": improvement,
+            "elapsed": elapsed,
+            "improvement_per_second": improvement / elapsed if elapsed > 0 else float('inf'),
+            "local_optimum": local_optimum,
+        }
+
+    # Every city starts active (don't-look bit off)
+    queue = deque(range(n))
+    active = [True] * n
+    applied = 0
+
+    while queue:
+        if time_limit is not None and time.perf_counter() - start_time > time_limit:
+            break
+        a = queue.popleft()
+        active[a] = False
+
+        touched = None
+        if "2-opt" in moves:
+            touched = improve_two_opt(a)
+        if touched is None and "or-opt" in moves:
+            touched = improve_or_opt(a)
+        if touched is None:
+            continue
+
+        # Cities whose edges changed get another look
+        applied += 1
+        for city in touched:
+            if not active[city]:
+                active[city] = True
+                queue.append(city)
+
+        if report_every is not None and applied % report_every == 0 and queue:
+            yield record(False)
+
+    yield record(not queue)
+
+def local_search(distances, route, moves=("2-opt", "or-opt"), k=8, max_segment=3, time_limit=None,
+                 candidates=None):
+    """
+    2-opt / Or-opt local search with candidate lists and don't-look bits
+
+    Only moves that connect a city to one of its k nearest neighbors are
+    tried, and a city is only looked at again after one of its tour edges
+    changed (its don't-look bit is cleared). The first improving move found
+    is applied. Distances are assumed symmetric, since 2-opt reverses part
+    of the tour.
+
+    Args:
+        distances: Distance matrix
+        route: Starting route, beginning and ending at city 0
+        moves: Neighborhoods to use, any of "2-opt" and "or-opt"
+        k: Size of the candidate list of every city
+        max_segment: Longest segment Or-opt moves (1..max_segment cities)
+        time_limit: Optional wall-clock budget in seconds
+        candidates: Optional precomputed nearest_neighbors(distances, k), to reuse across runs
+
+    Returns:
+        route: Improved route, beginning and ending at city 0
+        distance: Its total distance
+        stats: Dictionary with "moves", "improvement", "elapsed" and "improvement_per_second"
+    """
+    for result in local_search_stream(distances, route, moves, k, max_segment, time_limit, candidates):
+        pass
+    stats = {key: result[key] for key in ("moves", "improvement", "elapsed", "improvement_per_second")}
+    return result["route"], result["best_distance"], stats
+
+def swap_climb_stream(distances, route, max_iterations=100, time_limit=None):
+    """
+    Steepest descent over the swap neighborhood, one iteration per step
+
+    time_limit (seconds) is checked before every iteration.
+
+    Yields:
+        Dictionary per iteration with "iteration", "improved", "best_distance"
+        and "route" (the current route), "mean_distance" (average distance of
+        the swap neighbors), "improving_neighbors" (fraction of neighbors
+        better than the current route) and "elapsed" seconds
+    """
+    start_time = time.perf_counter()
+    current_route = list(route)
+    current_distance = calculate_total_distance(current_route, distances)
+    
+    iteration = 0
+    improved = True
+    
+    while improved and iteration < max_iterations:
+        if time_limit is not None and time.perf_counter() - start_time > time_limit:
+            break
+        improved = False
+        
+        # Score every swap neighbor at once
+        deltas = swap_deltas(current_route, distances)
+        valid = deltas[np.isfinite(deltas)]
+        
+        # Find the best neighbor (first one in (i, j) order on ties)
+        best_delta = 0
+        if deltas.size:
+            i, j = np.unravel_index(np.argmin(deltas), deltas.shape)
+            best_delta = deltas[i, j]
+        
+        # Neighborhood stats are taken before the move
+        mean_distance = (current_distance + valid.mean()).item() if valid.size else current_distance
+        improving_neighbors = (valid < 0).mean().item() if valid.size else 0.0
+        
+        # If we found a better neighbor, move to it
+        if best_delta < 0:
+            i, j = i + 1, j + 1
+            current_route[i], current_route[j] = current_route[j], current_route[i]
+            # Recompute exactly (O(n), vectorized) so the distance keeps its dtype and doesn't drift
+            route_array = np.asarray(current_route)
+            current_distance = distances[route_array[:-1], route_array[1:]].sum()
+            improved = True
+        
+        iteration += 1
+        yield {
+            "iteration": iteration,
+            "improved": improved,
+            "best_distance": current_distance,
+            "route": list(current_route),
+            "mean_distance": mean_distance,
+            "improving_neighbors": improving_neighbors,
+            "elapsed": time.perf_counter() - start_time,
+        }
+
+def swap_climb(distances, route, max_iterations=100, verbose=False, time_limit=None):
+    """
+    Steepest descent over the swap neighborhood from a given route
+
+    time_limit (seconds) is checked before every iteration.
+
+    Returns:
+        route: Final route
+        distance: Its total distance
+        iterations: Number of iterations run
+        improved: True if the last iteration still improved (stopped by max_iterations or time_limit)
+    """
+    current_route = list(route)
+    current_distance = calculate_total_distance(current_route, distances)
+    iteration, improved = 0, True
+    
+    for stats in swap_climb_stream(distances, current_route, max_iterations, time_limit):
+        current_route, current_distance = stats["route"], stats["best_distance"]
+        iteration, improved = stats["iteration"], stats["improved"]
+        if verbose and improved:
+            print(f"Iteration {iteration}: Found better route with distance {current_distance}")
+    
+    return current_route, current_distance, iteration, improved
+
+def hill_climbing_stream(distances, max_iterations=100, neighborhood="swap", k=8, route=None,
+                         time_limit=None, stagnation=None, target=None):
+    """
+    Hill climbing as a generator of per-iteration stats
+
+    The first record (iteration 0) describes the random starting route, then
+    the swap neighborhood yields one record per iteration (see
+    swap_climb_stream). The 2-opt / Or-opt neighborhoods run
+    local_search_stream and yield a record after every num_cities applied
+    moves plus one for the result, with "moves", "improvement_per_second"
+    and "local_optimum" added.
+
+    Iteration stops at a local optimum, after max_iterations, once
+    time_limit seconds have passed, after `stagnation` iterations without a
+    better route, or once the distance reaches target.
+    """
+    start_time = time.perf_counter()
+    distances = as_distances(distances)
+    num_cities = distances.shape[0]
+    if route is None:
+        # Create initial random solution (starting and ending at city 0)
+        route = [0] + random.sample(range(1, num_cities), num_cities - 1) + [0]
+    
+    def stream():
+        distance = calculate_total_distance(route, distances)
+        yield {"iteration": 0, "improved": False, "best_distance": distance, "route": list(route),
+               "elapsed": time.perf_counter() - start_time}
+        
+        if neighborhood == "swap":
+            for stats in swap_climb_stream(distances, route, max_iterations):
+                stats["elapsed"] = time.perf_counter() - start_time
+                yield stats
+            return
+        
+        # One record per num_cities applied moves, so target and stagnation apply mid-search
+        records = local_search_stream(distances, route, moves=neighborhood.split("+"), k=k,
+                                      time_limit=time_limit, report_every=num_cities)
+        for iteration, search_stats in enumerate(records, 1):
+            new_distance = search_stats["best_distance"]
+            yield {"iteration": iteration, "improved": new_distance < distance,
+                   "best_distance": new_distance, "route": search_stats["route"],
+                   "moves": search_stats["moves"],
+                   "improvement_per_second": search_stats["improvement_per_second"],
+                   "local_optimum": search_stats["local_optimum"],
+                   "elapsed": time.perf_counter() - start_time}
+            distance = new_distance
+    
+    return stop_early(stream(), time_limit, stagnation, target)
+
+def steepest_hill_climbing(distances, max_iterations=100, neighborhood="swap", k=8, time_limit=None,
+                           stagnation=None, target=None, verbose=False):
+    """
+    Steepest ascent hill climbing algorithm for TSP
+
+    neighborhood="swap" exchanges two cities per step (the original
+    neighborhood). "2-opt", "or-opt" and "2-opt+or-opt" run local_search
+    instead, which uses k-nearest candidate lists and don't-look bits and
+    scales to thousands of cities; max_iterations does not apply there.
+    time_limit (seconds) applies to every neighborhood; time_limit,
+    stagnation and target stop the climb early (see hill_climbing_stream);
+    verbose prints the progress.
+    """
+    current_route, current_distance = None, None
+    iteration, improved = 0, True
+    
+    for stats in hill_climbing_stream(distances, max_iterations, neighborhood, k,
+                                      time_limit=time_limit, stagnation=stagnation, target=target):
+        current_route, current_distance = stats["route"], stats["best_distance"]
+        if stats["iteration"] == 0:
+            if verbose:
+                print(f"Initial route: {current_route}")
+                print(f"Initial distance: {current_distance}")
+            continue
+        
+        iteration, improved = stats["iteration"], stats["improved"]
+        if not verbose:
+            continue
+        if stats.get("local_optimum"):
+            print(f"Local optimum reached after {stats['moves']} moves in {stats['elapsed']:.3f}s "
+                  f"({stats['improvement_per_second']:.1f} distance improvement per second)")
+        elif "moves" in stats:
+            print(f"Iteration {iteration}: {stats['moves']} moves, distance {current_distance}")
+        elif improved:
+            print(f"Iteration {iteration}: Found better route with distance {current_distance}")
+    
+    if verbose and neighborhood == "swap" and not improved:
+        print(f"Local optimum reached after {iteration} iterations")
+    
+    return current_route, current_distance
+
+# Per-process state for random-restart workers, set once by _init_restart_worker
+_worker_state = {}
+
+def _init_restart_worker(shared, candidates, incumbent, settings):
+    # Attach to the shared distances instead of receiving a copy per task
+    distances = attach_distances(shared)
+    _worker_state.update(shared=shared, distances=distances, candidates=candidates,
+                         incumbent=incumbent, **settings)
+
+def _climb_from_seed(restart, seed):
+    """One restart: random route from its own seed, climbed to a local optimum"""
+    state = _worker_state
+    deadline, target = state["deadline"], state["target"]
+
+    # Stopping criteria are checked before doing any work
+    if deadline is not None and time.time() >= deadline:
+        return restart, None, None
+    if target is not None and state["incumbent"].value <= target:
+        return restart, None, None
+
+    distances = state["distances"]
+    rng = np.random.default_rng(seed)
+    route = [0] + (rng.permutation(distances.shape[0] - 1) + 1).tolist() + [0]
+
+    time_limit = None if deadline is None else max(deadline - time.time(), 0)
+    if state["neighborhood"] == "swap":
+        route, distance, _, _ = swap_climb(distances, route, state["max_iterations"],
+                                           time_limit=time_limit)
+    else:
+        route, distance, _ = local_search(distances, route, moves=state["neighborhood"].split("+"),
+                                          time_limit=time_limit, candidates=state["candidates"])
+
+    distance = distance.item() if isinstance(distance, np.generic) else distance
+    incumbent = state["incumbent"]
+    with incumbent.get_lock():
+        if distance < incumbent.value:
+            incumbent.value = distance
+    return restart, route, distance
+
+def random_restart_hill_climbing(distances, restarts=100, workers=None, seed=None,
+                                 neighborhood="2-opt+or-opt", k=8, max_iterations=100,
+                                 time_limit=None, target=None):
+    """
+    Independent hill climbs from random starts, spread over a process pool
+
+    An in-memory distance matrix is placed in shared memory once and every
+    worker attaches to it; distance providers are sent to each worker as
+    they are. Each restart gets its own child of SeedSequence(seed), so
+    a restart produces the same local optimum no matter which worker runs it.
+    The best distance found so far is shared between the workers; once
+    time_limit has passed or the best distance reaches target, remaining
+    restarts are skipped. Climbs still running at the time limit stop at
+    their next iteration and keep the route reached so far.
+
+    Args:
+        distances: Distance matrix, DistanceProvider or path (see as_distances)
+        restarts: Maximum number of restarts
+        workers: Number of processes (defaults to the CPU count)
+        seed: Seed for the restart seeds
+        neighborhood: "swap", "2-opt", "or-opt" or "2-opt+or-opt" (see steepest_hill_climbing)
+        k: Candidate list size for the 2-opt / Or-opt neighborhoods
+        max_iterations: Iteration limit of the swap neighborhood
+        time_limit: Optional wall-clock budget in seconds
+        target: Optional tour length at which to stop
+
+    Returns:
+        best_route: Best route found
+        best_distance: Its total distance
+        stats: Dictionary with "distances" (final distance per completed restart,
+               in restart order), "restarts", "elapsed" and "restarts_per_second"
+    """
+    start_time = time.time()
+    distances = as_distances(distances)
+    seeds = np.random.SeedSequence(seed).spawn(restarts)
+
+    # Candidate lists only depend on the matrix, so they are built once here
+    candidates = None
+    if neighborhood != "swap":
+        candidates = nearest_neighbors(distances, k)
+
+    settings = {
+        "neighborhood": neighborhood,
+        "max_iterations": max_iterations,
+        "deadline": None if time_limit is None else start_time + time_limit,
+        "target": target,
+    }
+
+    context = multiprocessing.get_context()
+    incumbent = context.Value('d', float('inf'))
+    results = {}
+    with shared_distances(distances) as shared, ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_restart_worker,
+        initargs=(shared, candidates, incumbent, settings)
+    ) as pool:
+        futures = [pool.submit(_climb_from_seed, restart, restart_seed)
+                   for restart, restart_seed in enumerate(seeds)]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            restart, route, distance = future.result()
+            if route is None:
+                # A stopping criterion was met: drop what hasn't started yet
+                for pending in futures:
+                    pending.cancel()
+                continue
+            results[restart] = (route, distance)
+
+    elapsed = time.time() - start_time
+    finals = [results[restart][1] for restart in sorted(results)]
+    best_route, best_distance = None, float('inf')
+    if results:
+        best_route, best_distance = min(results.values(), key=lambda result: result[1])
+
+    stats = {
+        "distances": np.array(finals),
+        "restarts": len(results),
+        "elapsed": elapsed,
+        "restarts_per_second": len(results) / elapsed if elapsed > 0 else float('inf'),
+    }
+    return best_route, best_distance, stats
+
+def main():
+    """Run steepest hill climbing on the 5 city example"""
+    # Same distance matrix as in the genetic algorithm
+    distances = np.array([
+        [0, 10, 15, 20, 25],
+        [10, 0, 35, 25, 30],
+        [15, 35, 0, 30, 5],
+        [20, 25, 30, 0, 15],
+        [25, 30, 5, 15, 0]
+    ])
+
+    # Run the algorithm
+    best_route, best_distance = steepest_hill_climbing(distances, verbose=True)
+
+    print("\nFinal Results:")
+    print(f"Best route found: {best_route}")
+    print(f"Total distance: {best_distance}")
+
+    print("\nCity-by-city path:")
+    for i in range(len(best_route)-1):
+        print(f"City {best_route[i]} → City {best_route[i+1]}: Distance = {distances[best_route[i]][best_route[i+1]]}")
+
+if __name__ == "__main__":
+    main()
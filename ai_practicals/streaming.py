@@ -0,0 +1,37 @@
+def stop_early(stream, time_limit=None, stagnation=None, target=None):
+    """
+    Pass optimizer stats through until a stopping criterion is met
+
+    The record that meets a criterion is still yielded, then the underlying
+    generator is closed. Records must have "best_distance" and "elapsed".
+
+    Args:
+        stream: Generator of per-iteration stats dictionaries
+        time_limit: Stop once "elapsed" (seconds) reaches this value
+        stagnation: Stop after this many records without a better best_distance
+        target: Stop once best_distance is at most this value
+
+    Yields:
+        The records of stream
+    """
+    best = float('inf')
+    since_improvement = 0
+
+    try:
+        for stats in stream:
+            yield stats
+
+            if target is not None and stats["best_distance"] <= target:
+                return
+            if time_limit is not None and stats["elapsed"] >= time_limit:
+                return
+            if stagnation is not None:
+                if stats["best_distance"] < best:
+                    best = stats["best_distance"]
+                    since_improvement = 0
+                else:
+                    since_improvement += 1
+                    if since_improvement >= stagnation:
+                        return
+    finally:
+        stream.close()
@@ -0,0 +1,621 @@
+import hashlib
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import random
+
+from .distance_providers import DistanceProvider, as_distances, attach_distances, shared_distances
+from .streaming import stop_early
+
+def initialize_population(pop_size, num_cities, rng=None):
+    """
+    Creates an initial population of random routes
+    Example: For 5 cities, might generate route [0,2,1,4,3,0]
+
+    Args:
+        rng: Optional numpy.random.Generator; when given, all routes are
+             shuffled at once with it instead of with the random module
+
+    Returns:
+        Array of shape (pop_size, num_cities + 1), one route per row
+    """
+    population = np.zeros((pop_size, num_cities + 1), dtype=np.int64)
+    if rng is not None:
+        cities = np.broadcast_to(np.arange(1, num_cities), (pop_size, num_cities - 1))
+        population[:, 1:-1] = rng.permuted(cities, axis=1)
+        return population
+
+    for i in range(pop_size):
+        # Create a random permutation of cities (excluding the first city)
+        route = list(range(1, num_cities))
+        random.shuffle(route)
+        # Starting city (0) stays at beginning and end to complete the tour
+        population[i, 1:-1] = route
+    return population
+
+def calculate_fitness(route, distances):
+    """
+    Calculate fitness as inverse of total distance (shorter distance = higher fitness)
+    Example: For route [0,1,2,3,4,0] calculates distance 0→1→2→3→4→0
+    """
+    total_distance = population_distances([route], distances)[0]
+    
+    # We want to maximize fitness, so we use inverse of distance
+    if total_distance == 0:
+        return float('inf')  # Avoid division by zero
+    return 1 / total_distance
+
+def population_distances(population, distances):
+    """
+    Total distance of every route in the population at once
+    Example: For rows [0,1,2,3,4,0] and [0,2,1,4,3,0] returns both tour lengths
+
+    Returns:
+        Array of length pop_size
+    """
+    population = np.asarray(population)
+    return distances[population[:, :-1], population[:, 1:]].sum(axis=1)
+
+def canonical_tours(population, symmetric=True):
+    """
+    Rotation- (and direction-) normalized form of every route in the population
+    Example: [0,2,1,3,0], [1,3,0,2,1] and [0,3,1,2,0] all become [0,2,1,3]
+
+    Each tour is rotated to start at its smallest city. With symmetric
+    distances a tour and its reverse have the same length, so the direction
+    is also fixed: the second city is smaller than the last one.
+
+    Returns:
+        Array of shape (pop_size, num_cities), one canonical cycle per row
+    """
+    cycles = np.asarray(population)[:, :-1]
+    num_cities = cycles.shape[1]
+    shift = np.argmin(cycles, axis=1)
+    cycles = np.take_along_axis(cycles, (shift[:, None] + np.arange(num_cities)) % num_cities, axis=1)
+
+    if symmetric and num_cities > 2:
+        flip = cycles[:, 1] > cycles[:, -1]
+        cycles[flip, 1:] = cycles[flip, :0:-1]
+    return cycles
+
+class FitnessCache:
+    """
+    Memo of route distances keyed by the canonical tour, with LRU eviction
+
+    Routes that only differ by rotation (or direction, for symmetric
+    distances) share one entry. Within a batch every distinct missing tour
+    is evaluated once, so elitism and tournament copies never pay twice.
+    Entries are keyed by a 16-byte BLAKE2b digest of the canonical tour, so
+    memory per entry does not grow with the number of cities.
+
+    Parameters:
+    - distances: Distance matrix, DistanceProvider or path (used when
+      distance_function is not given)
+    - max_size: Maximum number of entries kept
+    - distance_function: Optional function mapping an array of routes
+      (one per row) to an array of their distances, for cost models that
+      aren't a plain matrix sum
+    - symmetric: Whether a tour and its reverse have the same distance
+      (None checks whether distances equals its transpose, or asks a
+      DistanceProvider; without distances only rotations are merged)
+    """
+    def __init__(self, distances=None, max_size=100000, distance_function=None, symmetric=None):
+        if distance_function is None:
+            if distances is None:
+                raise ValueError("FitnessCache needs distances or a distance_function")
+            distances = as_distances(distances)
+            distance_function = lambda routes: population_distances(routes, distances)
+        if symmetric is None:
+            if isinstance(distances, DistanceProvider):
+                # Never expand a provider to a full matrix just for this check
+                symmetric = distances.symmetric
+            else:
+                symmetric = distances is not None and np.allclose(distances, np.transpose(distances))
+        self.distance_function = distance_function
+        self.max_size = max_size
+        self.symmetric = symmetric
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def population_distances(self, population):
+        """Distance of every route in the population, evaluating only unseen tours"""
+        population = np.asarray(population)
+        keys = [hashlib.blake2b(cycle.tobytes(), digest_size=16).digest()
+                for cycle in canonical_tours(population, self.symmetric)]
+        results = [None] * len(keys)
+        missing = {}  # key -> first row with that tour
+
+        for row, key in enumerate(keys):
+            value = self.entries.get(key)
+            if value is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                results[row] = value
+            elif key in missing:
+                self.hits += 1  # same tour earlier in this batch
+            else:
+                self.misses += 1
+                missing[key] = row
+
+        if missing:
+            rows = list(missing.values())
+            for key, value in zip(missing, np.asarray(self.distance_function(population[rows])).tolist()):
+                self.entries[key] = value
+                self.entries.move_to_end(key)
+                if len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+                    self.evictions += 1
+                missing[key] = value
+
+            for row, key in enumerate(keys):
+                if results[row] is None:
+                    results[row] = missing[key]
+
+        return np.array(results)
+
+def tournament_index(fitness_values, tournament_size=3):
+    """
+    Tournament selection on indices - returns the index of the best of a random sample
+    Example: From 3 random individuals with fitness [0.1, 0.3, 0.2], returns the index of 0.3
+    """
+    # Select random tournament contestants
+    tournament_indices = random.sample(range(len(fitness_values)), tournament_size)
+    
+    # Find the best contestant
+    best_idx = tournament_indices[0]
+    for idx in tournament_indices:
+        if fitness_values[idx] > fitness_values[best_idx]:
+            best_idx = idx
+            
+    return best_idx
+
+def tournament_selection(population, fitness_values, tournament_size=3):
+    """
+    Tournament selection - selects the best individual from a random sample
+    Example: From 3 random individuals with fitness [0.1, 0.3, 0.2], selects the one with 0.3
+    """
+    return population[tournament_index(fitness_values, tournament_size)].copy()
+
+def crossover(parent1, parent2):
+    """
+    Ordered crossover (OX) for TSP
+    Example: parent1 = [0,1,2,3,4,0], parent2 = [0,4,1,3,2,0]
+    might produce child = [0,1,3,2,4,0]
+    """
+    # We exclude first and last city (fixed as 0)
+    size = len(parent1) - 2
+    
+    # Choose two crossover points
+    start, end = sorted(random.sample(range(size), 2))
+    
+    # Create child with parent1's values between crossover points
+    child = [0] * (size + 2)
+    
+    # Copy segment from parent1, marking its cities in a lookup table (O(1) membership)
+    in_child = bytearray(size + 2)
+    for i in range(start+1, end+1):
+        child[i] = parent1[i]
+        in_child[parent1[i]] = 1
+    
+    # Fill remaining positions with cities from parent2, maintaining order
+    # But skipping cities already in the child
+    fill = (city for city in parent2[1:-1] if not in_child[city])
+    for i in range(1, size+1):
+        if i <= start or i > end:
+            child[i] = next(fill)
+    
+    return child
+
+def mutate(route, mutation_rate):
+    """
+    Swap mutation - randomly swaps two cities in the route
+    Example: [0,1,2,3,4,0] might become [0,1,4,3,2,0]
+    """
+    if random.random() < mutation_rate:
+        # Select two positions to swap (excluding first and last)
+        idx1, idx2 = random.sample(range(1, len(route)-1), 2)
+        # Swap the cities
+        route[idx1], route[idx2] = route[idx2], route[idx1]
+    return route
+
+def _distinct_pairs(rng, count, low, high):
+    """Two different random integers in [low, high) per row, as arrays (first, second)"""
+    first = rng.integers(low, high, count)
+    second = rng.integers(low, high - 1, count)
+    second += second >= first  # skip over first, so the pair is uniform over distinct values
+    return first, second
+
+def batch_tournament_selection(fitness_values, count, rng, tournament_size=3):
+    """
+    Tournament selection for a whole generation at once
+    Example: count=4 returns 4 indices, each the best of 3 distinct random individuals
+
+    Returns:
+        Array of count indices into the population
+    """
+    fitness_values = np.asarray(fitness_values)
+    pop_size = len(fitness_values)
+
+    # Contestants are drawn without replacement, like random.sample; rows that
+    # drew someone twice are simply drawn again
+    contestants = rng.integers(0, pop_size, (count, tournament_size))
+    while tournament_size <= pop_size:
+        ordered = np.sort(contestants, axis=1)
+        repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if not repeated.any():
+            break
+        contestants[repeated] = rng.integers(0, pop_size, (repeated.sum(), tournament_size))
+
+    winners = np.argmax(fitness_values[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+def batch_crossover(parents1, parents2, rng):
+    """
+    Ordered crossover (OX) of many parent pairs at once
+    Example: rows [0,1,2,3,4,0] and [0,4,1,3,2,0] might produce child [0,1,3,2,4,0]
+
+    Each row gets its own crossover points. The segment of parent1 is kept in
+    place, and the cities of parent2 that are not in it fill the other
+    positions in parent2's order, all with array operations.
+
+    Returns:
+        Array of children, same shape as parents1
+    """
+    parents1 = np.asarray(parents1)
+    parents2 = np.asarray(parents2)
+    count, length = parents1.shape
+    size = length - 2
+    if size < 2:
+        return parents1.copy()
+
+    # Two distinct crossover points per row; the segment is positions start+1..end
+    start, end = _distinct_pairs(rng, count, 0, size)
+    start, end = np.minimum(start, end), np.maximum(start, end)
+    positions = np.arange(length)
+    in_segment = (positions > start[:, None]) & (positions <= end[:, None])
+
+    # Bitmask of the cities in each child's segment, indexed [row, city]
+    rows = np.arange(count)[:, None]
+    taken = np.zeros((count, length - 1), dtype=bool)
+    taken[rows, np.where(in_segment, parents1, 0)] = True
+    taken[:, 0] = False
+
+    # Every row has as many free positions as parent2 cities not taken, so
+    # row-major boolean indexing pairs them up in order
+    interior = parents2[:, 1:-1]
+    keep = ~taken[rows, interior]
+    free = ~in_segment
+    free[:, 0] = free[:, -1] = False
+
+    children = np.zeros_like(parents1)
+    children[in_segment] = parents1[in_segment]
+    children[free] = interior[keep]
+    return children
+
+def batch_mutate(population, mutation_rate, rng, kind="swap"):
+    """
+    Swap or inversion mutation of a whole population at once (in place)
+    Example: with kind="inversion", [0,1,2,3,4,0] might become [0,1,4,3,2,0]
+
+    Each route is mutated with probability mutation_rate. "swap" exchanges
+    two cities, "inversion" reverses the segment between two positions.
+
+    Returns:
+        The population
+    """
+    count, length = population.shape
+    if length < 4:
+        return population
+
+    mutated = np.flatnonzero(rng.random(count) < mutation_rate)
+    first, second = _distinct_pairs(rng, len(mutated), 1, length - 1)
+
+    if kind == "swap":
+        population[mutated, first], population[mutated, second] = (
+            population[mutated, second], population[mutated, first])
+    elif kind == "inversion":
+        low, high = np.minimum(first, second)[:, None], np.maximum(first, second)[:, None]
+        positions = np.arange(length)
+        inside = (positions >= low) & (positions <= high)
+        source = np.where(inside, low + high - positions, positions)
+        population[mutated] = np.take_along_axis(population[mutated], source, axis=1)
+    else:
+        raise ValueError(f"Unknown mutation kind: {kind}")
+    return population
+
+def population_diversity(population):
+    """
+    Fraction of distinct routes in the population (1.0 = all different)
+    Example: rows [0,1,2,0], [0,1,2,0], [0,2,1,0] give 2/3
+    """
+    return len(np.unique(population, axis=0)) / len(population)
+
+def evolve_stream(population, distances, rng, mutation_rate=0.1, mutation="swap", generations=None,
+                  cache=None, track_diversity=False):
+    """
+    Run the generation loop on an existing population, one generation per step
+
+    Args:
+        generations: Number of generations (None runs until the caller stops)
+        cache: Optional FitnessCache used to score the routes
+        track_diversity: Also report population_diversity, which sorts the
+                         whole population every generation
+
+    Yields:
+        Dictionary per generation with "generation", "best_distance" and
+        "best_route" (best so far), "mean_distance" of the generation,
+        "elapsed" seconds, and "next_population" (the bred population the
+        next generation starts from). With track_diversity it also has the
+        "diversity" of the generation.
+    """
+    start_time = time.perf_counter()
+    pop_size = len(population)
+    
+    # Track best route
+    best_distance = float('inf')
+    best_route = None
+    
+    gen = 0
+    while generations is None or gen < generations:
+        # Distance and fitness of the whole generation in one vectorized step
+        if cache is not None:
+            route_distances = cache.population_distances(population)
+        else:
+            route_distances = population_distances(population, distances)
+        with np.errstate(divide="ignore"):
+            fitness_values = 1 / route_distances
+        
+        # Find best route in current generation
+        best_idx = np.argmin(route_distances)
+        current_best_distance = route_distances[best_idx].item()
+        
+        # Update overall best
+        if current_best_distance < best_distance:
+            best_distance = current_best_distance
+            best_route = population[best_idx].tolist()
+        
+        # Create next generation
+        new_population = np.empty_like(population)
+        
+        # Elitism: Keep the best individual
+        new_population[0] = population[best_idx]
+        
+        # Create rest of the new population in one batch
+        # Tournament selection
+        parents1 = batch_tournament_selection(fitness_values, pop_size - 1, rng)
+        parents2 = batch_tournament_selection(fitness_values, pop_size - 1, rng)
+        
+        # Crossover
+        children = batch_crossover(population[parents1], population[parents2], rng)
+        
+        # Mutation
+        new_population[1:] = batch_mutate(children, mutation_rate, rng, mutation)
+        
+        stats = {
+            "generation": gen,
+            "best_distance": best_distance,
+            "best_route": best_route,
+            "mean_distance": route_distances.mean().item(),
+            "elapsed": time.perf_counter() - start_time,
+            "next_population": new_population,
+        }
+        if track_diversity:
+            stats["diversity"] = population_diversity(population)
+        yield stats
+        
+        # Replace old population
+        population = new_population
+        gen += 1
+
+def evolve(population, distances, generations, mutation_rate, rng, mutation="swap"):
+    """
+    Run the generation loop on an existing population
+
+    Returns:
+        population: Population after the last generation
+        best_route: Best route seen (None if generations is 0)
+        best_distance: Its total distance
+        progress: Best distance so far after each generation
+    """
+    best_route, best_distance = None, float('inf')
+    progress = []
+    for stats in evolve_stream(population, distances, rng, mutation_rate, mutation, generations):
+        population = stats["next_population"]
+        best_route, best_distance = stats["best_route"], stats["best_distance"]
+        progress.append(best_distance)
+    return population, best_route, best_distance, progress
+
+def genetic_algorithm_stream(distances, pop_size=50, generations=None, mutation_rate=0.1, seed=None,
+                             mutation="swap", time_limit=None, stagnation=None, target=None,
+                             cache=None, track_diversity=False):
+    """
+    Genetic algorithm as a generator of per-generation stats (see evolve_stream)
+
+    Iteration stops after `generations`, once time_limit seconds have passed,
+    after `stagnation` generations without a better route, or once the best
+    distance reaches target, whichever comes first. The caller can also just
+    stop iterating. cache is an optional FitnessCache; track_diversity adds
+    "diversity" to every record.
+    """
+    distances = as_distances(distances)
+    rng = np.random.default_rng(seed)
+    population = initialize_population(pop_size, distances.shape[0], rng)
+    stream = evolve_stream(population, distances, rng, mutation_rate, mutation, generations, cache,
+                           track_diversity)
+    return stop_early(stream, time_limit, stagnation, target)
+
+def genetic_algorithm(distances, pop_size=50, generations=100, mutation_rate=0.1,
+                      seed=None, mutation="swap", time_limit=None, stagnation=None,
+                      target=None, verbose=False, cache=None):
+    """
+    Main genetic algorithm for TSP with tournament selection
+
+    Selection, crossover and mutation each produce the whole next generation
+    at once from a numpy.random.Generator, so a run is reproducible from seed.
+    mutation is "swap" or "inversion". time_limit, stagnation and target stop
+    the run early (see genetic_algorithm_stream); verbose prints every new best route.
+    Pass a FitnessCache as cache to skip re-evaluating routes seen before.
+    """
+    best_route, best_distance = None, float('inf')
+    for stats in genetic_algorithm_stream(distances, pop_size, generations, mutation_rate, seed,
+                                          mutation, time_limit, stagnation, target, cache):
+        if stats["best_distance"] < best_distance:
+            best_route, best_distance = stats["best_route"], stats["best_distance"]
+            if verbose:
+                print(f"Generation {stats['generation']}: New best route: {best_route} "
+                      f"with distance: {best_distance:.2f}")
+    return best_route, best_distance
+
+# Per-process state for island workers, set once by _init_island_worker
+_worker_state = {}
+
+def _init_island_worker(shared, settings):
+    # Attach to the shared distances instead of receiving a copy per task
+    distances = attach_distances(shared)
+    _worker_state.update(shared=shared, distances=distances, **settings)
+
+def _evolve_island(island, population, rng, generations):
+    """Evolve one island for one epoch; the Generator travels with the population"""
+    state = _worker_state
+    population, best_route, best_distance, progress = evolve(
+        population, state["distances"], generations, state["mutation_rate"], rng, state["mutation"])
+    return island, population, rng, best_route, best_distance, progress
+
+def _migrate(populations, distances, migrants, topology, rng):
+    """Copy the best routes of every island over the worst routes of its target island"""
+    num_islands = len(populations)
+    if topology == "ring":
+        targets = [(island + 1) % num_islands for island in range(num_islands)]
+    elif topology == "random":
+        # Any island except the sender itself
+        targets = [(island + 1 + rng.integers(num_islands - 1)) % num_islands
+                   for island in range(num_islands)]
+    else:
+        raise ValueError(f"Unknown migration topology: {topology}")
+
+    # Pick all emigrants before anyone is replaced
+    order = [np.argsort(population_distances(population, distances), kind="stable")
+             for population in populations]
+    emigrants = [populations[island][order[island][:migrants]].copy() for island in range(num_islands)]
+
+    # An island picked by several senders takes each group over its next-worst
+    # routes, never over its best one
+    replaced = [0] * num_islands
+    for island, target in enumerate(targets):
+        end = len(order[target]) - replaced[target]
+        worst = order[target][max(end - migrants, 1):end]
+        populations[target][worst] = emigrants[island][:len(worst)]
+        replaced[target] += len(worst)
+
+def island_genetic_algorithm(distances, islands=4, pop_size=50, generations=100, mutation_rate=0.1,
+                             migration_interval=10, migrants=2, topology="ring", seed=None,
+                             mutation="swap", workers=None):
+    """
+    Island-model genetic algorithm: several populations evolve in separate processes
+
+    Every migration_interval generations the islands exchange their best
+    routes: each island's top `migrants` replace the worst routes of its
+    neighbor on a ring, or of a random other island. An in-memory distance
+    matrix is placed in shared memory once; distance providers are sent to
+    each worker as they are. Each island has its own Generator spawned
+    from SeedSequence(seed), and migration happens in this process between
+    epochs, so a run is reproducible from seed whatever the scheduling.
+
+    Args:
+        distances: Distance matrix, DistanceProvider or path (see as_distances)
+        islands: Number of populations
+        pop_size: Population size per island
+        generations: Generations per island
+        mutation_rate: Probability of mutating a child
+        migration_interval: Generations between migrations
+        migrants: Routes sent by every island per migration
+        topology: "ring" or "random"
+        seed: Seed for the island and migration generators
+        mutation: "swap" or "inversion"
+        workers: Number of processes (defaults to the CPU count)
+
+    Returns:
+        best_route: Best route over all islands
+        best_distance: Its total distance
+        stats: Dictionary with "curves" (array of shape (islands, generations)
+               with each island's best distance so far) and "elapsed"
+    """
+    start_time = time.time()
+    distances = as_distances(distances)
+    migrants = min(migrants, pop_size - 1)  # the elite of the target island is never replaced
+
+    *island_seeds, migration_seed = np.random.SeedSequence(seed).spawn(islands + 1)
+    rngs = [np.random.default_rng(island_seed) for island_seed in island_seeds]
+    migration_rng = np.random.default_rng(migration_seed)
+    populations = [initialize_population(pop_size, distances.shape[0], rng) for rng in rngs]
+
+    curves = [[] for _ in range(islands)]
+    best_route, best_distance = None, float('inf')
+    settings = {"mutation_rate": mutation_rate, "mutation": mutation}
+
+    context = multiprocessing.get_context()
+    with shared_distances(distances) as shared, ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_island_worker,
+        initargs=(shared, settings)
+    ) as pool:
+        done = 0
+        while done < generations:
+            epoch = min(migration_interval, generations - done)
+            futures = [pool.submit(_evolve_island, island, populations[island], rngs[island], epoch)
+                       for island in range(islands)]
+
+            for future in as_completed(futures):
+                island, population, rng, route, distance, progress = future.result()
+                populations[island], rngs[island] = population, rng
+                if distance < best_distance:
+                    best_route, best_distance = route, distance
+
+                # Progress within an epoch is per epoch; the curve keeps the best so far
+                previous = curves[island][-1] if curves[island] else float('inf')
+                curves[island].extend(min(previous, value) for value in progress)
+
+            done += epoch
+            if done < generations and islands > 1 and migrants > 0:
+                _migrate(populations, distances, migrants, topology, migration_rng)
+
+    stats = {"curves": np.array(curves), "elapsed": time.time() - start_time}
+    return best_route, best_distance, stats
+
+def main():
+    """Run the genetic algorithm on the 5 city example"""
+    # Sample adjacency matrix representing distances between cities
+    # Each value represents the distance between city i and city j
+    distances = np.array([
+        [0, 10, 15, 20, 25],
+        [10, 0, 35, 25, 30],
+        [15, 35, 0, 30, 5],
+        [20, 25, 30, 0, 15],
+        [25, 30, 5, 15, 0]
+    ])
+
+    # Run the genetic algorithm
+    best_route, best_distance = genetic_algorithm(distances, pop_size=50, generations=100, mutation_rate=0.1, verbose=True)
+
+    print("\nFinal Results:")
+    print(f"Best route found: {best_route}")
+    print(f"Total distance: {best_distance:.2f}")
+
+    print("\nCity-by-city path:")
+    for i in range(len(best_route)-1):
+        print(f"City {best_route[i]} → City {best_route[i+1]}: Distance = {distances[best_route[i]][best_route[i+1]]}")
+
+if __name__ == "__main__":
+    main()
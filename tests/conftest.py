@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pytest
+
+@pytest.fixture
+def rng(request):
+    """random.Random seeded with the test's indirect parameter (0 when not parametrized)"""
+    return random.Random(getattr(request, "param", 0))
+
+@pytest.fixture
+def np_rng(request):
+    """numpy Generator seeded with the test's indirect parameter (0 when not parametrized)"""
+    return np.random.default_rng(getattr(request, "param", 0))
+
+@pytest.fixture
+def random_graph(rng):
+    """
+    Factory for directed adjacency matrices with integer costs in 1..max_cost
+
+    Missing edges (and the diagonal, for no_edge=0) hold no_edge: inf for the
+    weighted searches, 0 with max_cost=1 for a 0/1 matrix.
+    """
+    def make(num_nodes, edge_probability, max_cost=20, no_edge=float('inf')):
+        return [
+            [0 if i == j else (rng.randint(1, max_cost) if rng.random() < edge_probability else no_edge)
+             for j in range(num_nodes)]
+            for i in range(num_nodes)
+        ]
+    return make
+
+@pytest.fixture
+def random_instance(np_rng):
+    """Factory for symmetric Euclidean TSP distance matrices of random points"""
+    def make(num_cities, integer=False):
+        points = np_rng.random((num_cities, 2)) * 100
+        distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(axis=-1))
+        return np.rint(distances).astype(np.int64) if integer else distances
+    return make
+
+@pytest.fixture
+def assert_valid_tour():
+    """Check that a route visits every city once, starting and ending at city 0"""
+    def check(route, num_cities):
+        route = list(route)
+        assert route[0] == route[-1] == 0
+        assert sorted(route[:-1]) == list(range(num_cities))
+    return check
@@ -0,0 +1,74 @@
+import math
+
+import pytest
+
+from ai_practicals.a_star import a_star_search, a_star_search_with_stats, bidirectional_a_star
+from ai_practicals.graph import CSRGraph
+from ai_practicals.landmarks import LandmarkHeuristic, shortest_path_distances
+
+def all_pairs_distances(graph):
+    """Floyd-Warshall, as the reference shortest path costs"""
+    n = len(graph)
+    distances = [list(row) for row in graph]
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                if distances[i][k] + distances[k][j] < distances[i][j]:
+                    distances[i][j] = distances[i][k] + distances[k][j]
+    return distances
+
+def path_cost(graph, path):
+    return sum(graph[a][b] for a, b in zip(path, path[1:]))
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_a_star_matches_floyd_warshall(rng, random_graph):
+    graph = random_graph(rng.randint(2, 20), rng.choice([0.1, 0.2, 0.4]))
+    distances = all_pairs_distances(graph)
+    start = rng.randrange(len(graph))
+
+    for goal in range(len(graph)):
+        # Half the true distance is admissible, 0 turns A* into Dijkstra
+        half = [0 if math.isinf(row[goal]) else row[goal] // 2 for row in distances]
+        for heuristic in ([0] * len(graph), half):
+            path, cost, stats = a_star_search_with_stats(graph, start, goal, heuristic)
+            assert stats["expanded"] <= len(graph)
+            if math.isinf(distances[start][goal]):
+                assert path is None and math.isinf(cost)
+            else:
+                assert cost == distances[start][goal]
+                assert path[0] == start and path[-1] == goal
+                assert path_cost(graph, path) == cost
+                assert a_star_search(graph, start, goal, heuristic) == (path, cost)
+
+@pytest.mark.parametrize("rng", range(30), indirect=True)
+def test_bidirectional_matches_dijkstra(rng, random_graph):
+    graph = random_graph(rng.randint(2, 25), rng.choice([0.1, 0.2, 0.4]))
+    start, goal = rng.randrange(len(graph)), rng.randrange(len(graph))
+    expected = shortest_path_distances(graph, start)[goal]
+
+    path, cost, _ = bidirectional_a_star(graph, start, goal)
+    if math.isinf(expected):
+        assert path is None and math.isinf(cost)
+    else:
+        assert cost == expected
+        assert path[0] == start and path[-1] == goal
+        assert path_cost(graph, path) == cost
+
+@pytest.mark.parametrize("rng", range(30), indirect=True)
+def test_bidirectional_with_alt_potentials_matches_dijkstra(rng, random_graph):
+    graph = random_graph(rng.randint(2, 25), rng.choice([0.1, 0.2, 0.4]))
+    start, goal = rng.randrange(len(graph)), rng.randrange(len(graph))
+    expected = shortest_path_distances(graph, start)[goal]
+
+    heuristic = LandmarkHeuristic.build(graph, num_landmarks=3, seed=rng.randrange(100))
+    path, cost, _ = bidirectional_a_star(
+        graph, start, goal,
+        heuristic_costs=heuristic.costs(goal),
+        reverse_heuristic_costs=heuristic.reverse().costs(start),
+        reverse_graph=CSRGraph.from_matrix(graph, no_edge=float('inf')).reverse(),
+    )
+    if math.isinf(expected):
+        assert path is None
+    else:
+        assert cost == expected
+        assert path_cost(graph, path) == cost
@@ -0,0 +1,45 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from ai_practicals.bfs import bfs, bfs_levels
+from ai_practicals.graph import CSRGraph
+
+def hop_distances(graph, sources):
+    """Plain queue BFS from every source, as the reference distances"""
+    distances = [-1] * len(graph)
+    queue = deque(sources)
+    for source in sources:
+        distances[source] = 0
+    while queue:
+        current = queue.popleft()
+        for neighbor in range(len(graph)):
+            if graph[current][neighbor] and distances[neighbor] == -1:
+                distances[neighbor] = distances[current] + 1
+                queue.append(neighbor)
+    return distances
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_levels_match_queue_bfs(rng, random_graph):
+    graph = random_graph(rng.randint(1, 25), 0.15, max_cost=1, no_edge=0)
+    sources = rng.sample(range(len(graph)), rng.randint(1, min(3, len(graph))))
+
+    distances, parents = bfs_levels(graph, sources if len(sources) > 1 else sources[0])
+    assert distances.tolist() == hop_distances(graph, sources)
+    for vertex, parent in enumerate(parents.tolist()):
+        if distances[vertex] > 0:
+            assert graph[parent][vertex] and distances[parent] == distances[vertex] - 1
+        else:
+            assert parent == -1
+
+def test_levels_on_a_long_chain():
+    n = 1000
+    distances, parents = bfs_levels(CSRGraph.from_edges(n, [(v, v + 1) for v in range(n - 1)]), 0)
+    assert np.array_equal(distances, np.arange(n))
+    assert np.array_equal(parents, np.arange(-1, n - 1))
+
+def test_bfs_visit_order(capsys):
+    graph = [[0, 1, 1, 0], [1, 0, 1, 1], [1, 1, 0, 1], [0, 1, 1, 0]]
+    assert bfs(graph, 0) == [0, 1, 2, 3]
+    assert capsys.readouterr().out.count("Visiting vertex") == 4
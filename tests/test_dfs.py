@@ -0,0 +1,52 @@
+import pytest
+
+from ai_practicals.dfs import dfs, dfs_events, dfs_traversal
+from ai_practicals.graph import CSRGraph
+
+def recursive_dfs(graph, vertex, visited):
+    """The original recursive traversal, as the reference order"""
+    visited.append(vertex)
+    for neighbor in range(len(graph)):
+        if graph[vertex][neighbor] and neighbor not in visited:
+            recursive_dfs(graph, neighbor, visited)
+    return visited
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_traversal_matches_recursive_dfs(rng, random_graph):
+    graph = random_graph(rng.randint(1, 20), 0.2, max_cost=1, no_edge=0)
+    start = rng.randrange(len(graph))
+    expected = recursive_dfs(graph, start, [])
+
+    traversal = dfs_traversal(graph, start)
+    assert traversal["preorder"].tolist() == expected
+    assert sorted(traversal["postorder"].tolist()) == sorted(expected)
+    for vertex in expected:
+        assert traversal["discovery"][vertex] < traversal["finish"][vertex]
+        parent = traversal["parent"][vertex]
+        if vertex != start:
+            assert graph[parent][vertex]
+            assert traversal["discovery"][parent] < traversal["discovery"][vertex]
+            assert traversal["finish"][vertex] < traversal["finish"][parent]
+
+def test_long_path_does_not_recurse():
+    n = 20000
+    chain = CSRGraph.from_edges(n, [(v, v + 1) for v in range(n - 1)])
+    traversal = dfs_traversal(chain, 0)
+    assert traversal["preorder"].tolist() == list(range(n))
+    assert traversal["postorder"].tolist() == list(range(n - 1, -1, -1))
+
+def test_events_stop_early_and_skip_visited():
+    chain = CSRGraph.from_edges(5, [(v, v + 1) for v in range(4)])
+    events = dfs_events(chain, 0)
+    assert [next(events)[1] for _ in range(3)] == [0, 1, 2]
+
+    seen = bytearray(5)
+    seen[2] = 1
+    assert [vertex for event, vertex, _, _ in dfs_events(chain, 0, seen) if event == "pre"] == [0, 1]
+
+def test_dfs_keeps_visited_and_path(capsys):
+    graph = [[0, 1, 1], [1, 0, 0], [1, 0, 0]]
+    visited = {2}
+    assert dfs(graph, 0, visited) == [0, 1]
+    assert visited == {0, 1, 2}
+    assert "Visiting vertex 1" in capsys.readouterr().out
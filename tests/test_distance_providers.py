@@ -0,0 +1,190 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from ai_practicals.distance_providers import (CoordinateDistances, DistanceProvider, NpyDistances,
+                                              as_distances, attach_distances, load_tsplib, shared_distances)
+from ai_practicals.steepest_hill import local_search
+from ai_practicals.tsp_genetic import FitnessCache, population_distances
+
+# Small symmetric matrix the explicit formats are written from
+MATRIX = np.array([
+    [0, 3, 5, 9, 4],
+    [3, 0, 7, 2, 8],
+    [5, 7, 0, 6, 1],
+    [9, 2, 6, 0, 11],
+    [4, 8, 1, 11, 0],
+])
+
+def explicit_weights(edge_weight_format):
+    """Numbers of an EDGE_WEIGHT_SECTION listed in the TSPLIB order of the format"""
+    n = len(MATRIX)
+    if edge_weight_format == "FULL_MATRIX":
+        return MATRIX.ravel().tolist()
+    diagonal = "DIAG" in edge_weight_format
+    upper = edge_weight_format.startswith("UPPER")
+    keep = (lambda i, j: j >= i) if upper else (lambda i, j: j <= i)
+    if not diagonal:
+        keep = (lambda i, j: j > i) if upper else (lambda i, j: j < i)
+    if edge_weight_format.endswith("ROW"):
+        return [MATRIX[i, j] for i in range(n) for j in range(n) if keep(i, j)]
+    return [MATRIX[i, j] for j in range(n) for i in range(n) if keep(i, j)]
+
+def write_tsplib(path, header, section, lines):
+    path.write_text("\n".join([f"{key} : {value}" for key, value in header.items()]
+                              + [section] + lines + ["EOF", ""]))
+    return str(path)
+
+@pytest.mark.parametrize("edge_weight_format", [
+    "FULL_MATRIX", "UPPER_ROW", "LOWER_ROW", "UPPER_DIAG_ROW", "LOWER_DIAG_ROW",
+    "UPPER_COL", "LOWER_COL", "UPPER_DIAG_COL", "LOWER_DIAG_COL",
+])
+def test_explicit_formats_give_the_known_matrix(edge_weight_format, tmp_path):
+    weights = [str(weight) for weight in explicit_weights(edge_weight_format)]
+    # Line breaks in the section carry no meaning
+    lines = [" ".join(weights[start:start + 3]) for start in range(0, len(weights), 3)]
+    path = write_tsplib(tmp_path / "explicit.tsp",
+                        {"NAME": "explicit5", "TYPE": "TSP", "DIMENSION": 5,
+                         "EDGE_WEIGHT_TYPE": "EXPLICIT", "EDGE_WEIGHT_FORMAT": edge_weight_format},
+                        "EDGE_WEIGHT_SECTION", lines)
+
+    matrix = load_tsplib(path)
+    assert matrix.dtype == np.int64
+    assert (matrix == MATRIX).all()
+
+def test_unsupported_tsplib_inputs_are_rejected(tmp_path):
+    path = write_tsplib(tmp_path / "bad.tsp", {"DIMENSION": 2, "EDGE_WEIGHT_TYPE": "EXPLICIT",
+                                                "EDGE_WEIGHT_FORMAT": "FUNCTION"},
+                        "EDGE_WEIGHT_SECTION", ["0 1 1 0"])
+    with pytest.raises(ValueError):
+        load_tsplib(path)
+
+    path = write_tsplib(tmp_path / "bad.tsp", {"DIMENSION": 2, "EDGE_WEIGHT_TYPE": "MAN_2D"},
+                        "NODE_COORD_SECTION", ["1 0 0", "2 1 1"])
+    with pytest.raises(ValueError):
+        load_tsplib(path)
+    with pytest.raises(ValueError):
+        CoordinateDistances([[0, 0]], "manhattan")
+
+# TSPLIB instances with their published optimal tours and lengths
+BURMA14 = [(16.47, 96.10), (16.47, 94.44), (20.09, 92.54), (22.39, 93.37), (25.23, 97.24), (22.00, 96.05),
+           (20.47, 97.02), (17.20, 96.29), (16.30, 97.38), (14.05, 98.12), (16.53, 97.38), (21.52, 95.59),
+           (19.41, 97.13), (20.09, 94.55)]
+BURMA14_TOUR = [1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]
+
+ULYSSES16 = [(38.24, 20.42), (39.57, 26.15), (40.56, 25.32), (36.26, 23.12), (33.48, 10.54), (37.56, 12.19),
+             (38.42, 13.11), (37.52, 20.44), (41.23, 9.10), (41.17, 13.05), (36.08, -5.21), (38.47, 15.13),
+             (38.15, 15.35), (37.51, 15.17), (35.49, 14.32), (39.36, 19.56)]
+ULYSSES16_TOUR = [1, 14, 13, 12, 7, 6, 15, 5, 11, 9, 10, 16, 3, 2, 4, 8]
+
+ATT48 = [(6734, 1453), (2233, 10), (5530, 1424), (401, 841), (3082, 1644), (7608, 4458), (7573, 3716),
+         (7265, 1268), (6898, 1885), (1112, 2049), (5468, 2606), (5989, 2873), (4706, 2674), (4612, 2035),
+         (6347, 2683), (6107, 669), (7611, 5184), (7462, 3590), (7732, 4723), (5900, 3561), (4483, 3369),
+         (6101, 1110), (5199, 2182), (1633, 2809), (4307, 2322), (675, 1006), (7555, 4819), (7541, 3981),
+         (3177, 756), (7352, 4506), (7545, 2801), (3245, 3305), (6426, 3173), (4608, 1198), (23, 2216),
+         (7248, 3779), (7762, 4595), (7392, 2244), (3484, 2829), (6271, 2135), (4985, 140), (1916, 1569),
+         (7280, 4899), (7509, 3239), (10, 2676), (6807, 2993), (5185, 3258), (3023, 1942)]
+ATT48_TOUR = [1, 8, 38, 31, 44, 18, 7, 28, 6, 37, 19, 27, 17, 43, 30, 36, 46, 33, 20, 47, 21, 32, 39, 48, 5, 42,
+              24, 10, 45, 35, 4, 26, 2, 29, 34, 41, 16, 22, 3, 23, 14, 25, 13, 11, 12, 15, 40, 9]
+
+@pytest.mark.parametrize("name, metric, coordinates, tour, length", [
+    ("burma14", "GEO", BURMA14, BURMA14_TOUR, 3323),
+    ("ulysses16", "GEO", ULYSSES16, ULYSSES16_TOUR, 6859),
+    ("att48", "ATT", ATT48, ATT48_TOUR, 10628),
+])
+def test_optimal_tours_have_the_published_length(name, metric, coordinates, tour, length, tmp_path):
+    path = write_tsplib(tmp_path / f"{name}.tsp",
+                        {"NAME": name, "TYPE": "TSP", "DIMENSION": len(coordinates), "EDGE_WEIGHT_TYPE": metric},
+                        "NODE_COORD_SECTION",
+                        [f"{city} {x} {y}" for city, (x, y) in enumerate(coordinates, 1)])
+    distances = load_tsplib(path)
+    assert isinstance(distances, CoordinateDistances) and distances.metric == metric.lower()
+
+    # TSPLIB numbers cities from 1; the loader from 0
+    route = [city - 1 for city in tour]
+    route = route[route.index(0):] + route[:route.index(0)] + [0]
+    assert population_distances([route], distances)[0] == length
+    assert sum(distances.item(a, b) for a, b in zip(route, route[1:])) == length
+
+@pytest.mark.parametrize("metric", ["euclidean", "euc_2d", "ceil_2d", "att", "geo"])
+def test_lazy_indexing_matches_the_dense_matrix(metric):
+    rng = np.random.default_rng(0)
+    coordinates = rng.random((30, 2)) * (90 if metric == "geo" else 1000)
+    distances = CoordinateDistances(coordinates, metric, row_cache_size=4)
+    dense = np.asarray(distances)
+    assert dense.shape == distances.shape == (30, 30) and len(distances) == 30
+    assert (np.diag(dense) == 0).all() and (dense == dense.T).all() and distances.symmetric
+
+    rows, columns = rng.integers(0, 30, 50), rng.integers(0, 30, 50)
+    np.testing.assert_array_equal(distances[rows, columns], dense[rows, columns])
+    np.testing.assert_array_equal(distances[np.ix_(rows[:5], columns[:7])], dense[np.ix_(rows[:5], columns[:7])])
+    np.testing.assert_array_equal(distances[rows[:3]], dense[rows[:3]])
+    for i, j in zip(rows[:10].tolist(), columns[:10].tolist()):
+        np.testing.assert_array_equal(distances[i], dense[i])
+        assert distances.item(i, j) == pytest.approx(dense[i, j])
+        assert distances[i, j] == dense[i, j] and np.ndim(distances[i, j]) == 0
+
+def test_row_cache_is_bounded_and_skipped_by_pickle():
+    distances = CoordinateDistances(np.random.default_rng(1).random((20, 2)), row_cache_size=3)
+    for i in [0, 1, 2, 0, 3, 4]:
+        distances.row(i)
+    assert list(distances.rows) == [0, 3, 4]
+    assert (distances.hits, distances.misses) == (1, 5)
+    with pytest.raises(ValueError):
+        distances.row(0)[1] = 5  # cached rows are read-only
+
+    copy = pickle.loads(pickle.dumps(distances))
+    assert len(copy.rows) == 0
+    np.testing.assert_array_equal(np.asarray(copy), np.asarray(distances))
+
+def test_npy_distances_are_memory_mapped(tmp_path):
+    matrix = np.random.default_rng(2).integers(1, 100, (12, 12))
+    np.save(tmp_path / "matrix.npy", matrix)
+
+    distances = as_distances(str(tmp_path / "matrix.npy"))
+    assert isinstance(distances, NpyDistances) and isinstance(distances.matrix, np.memmap)
+    assert not distances.symmetric
+    np.testing.assert_array_equal(np.asarray(distances), matrix)
+    np.testing.assert_array_equal(distances[[1, 2], [3, 4]], matrix[[1, 2], [3, 4]])
+    np.testing.assert_array_equal(distances.row(5), matrix[5])
+    assert distances.item(3, 7) == matrix[3, 7]
+
+    assert pickle.loads(pickle.dumps(distances)).path == distances.path
+    assert len(pickle.dumps(distances)) < matrix.nbytes
+
+def test_as_distances_and_shared_distances():
+    matrix = np.arange(16.0).reshape(4, 4)
+    assert as_distances(matrix) is matrix
+    assert isinstance(as_distances(matrix.tolist()), np.ndarray)
+
+    with shared_distances(matrix) as handle:
+        # As in a worker: the unpickled handle has to outlive the attached array
+        worker_handle = pickle.loads(pickle.dumps(handle))
+        np.testing.assert_array_equal(attach_distances(worker_handle), matrix)
+
+    provider = CoordinateDistances([[0, 0], [3, 4]])
+    assert as_distances(provider) is provider
+    with shared_distances(provider) as handle:
+        assert attach_distances(handle) is provider
+
+def test_provider_must_implement_pair():
+    class Unfinished(DistanceProvider):
+        num_cities = 3
+
+    with pytest.raises(TypeError):
+        Unfinished()
+
+def test_optimizers_accept_providers(tmp_path):
+    coordinates = np.random.default_rng(3).random((40, 2)) * 100
+    provider = CoordinateDistances(coordinates)
+    dense = np.asarray(provider)
+    route = list(range(40)) + [0]
+
+    new_route, distance, _ = local_search(provider, route)
+    assert (new_route, distance) == pytest.approx(local_search(dense, route)[:2])
+
+    cache = FitnessCache(provider)
+    assert cache.symmetric
+    np.testing.assert_allclose(cache.population_distances([route, route[::-1]]),
+                               population_distances([route, route], dense))
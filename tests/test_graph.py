@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from ai_practicals.a_star import a_star_search
+from ai_practicals.graph import CSRGraph, as_graph
+
+def edge_list(graph):
+    return [(i, j, cost) for i, row in enumerate(graph) for j, cost in enumerate(row)
+            if not math.isinf(cost)]
+
+def test_from_matrix_keeps_sorted_neighbors_and_int_costs():
+    graph = CSRGraph.from_matrix([[0, 0, 3], [1, 0, 0], [2, 5, 0]])
+    assert [graph.neighbors(v) for v in range(3)] == [[2], [0], [0, 1]]
+    assert list(graph.edges(2)) == [(0, 2), (1, 5)]
+    assert graph.weights.dtype == np.int64
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_from_edges_matches_from_matrix(rng, random_graph):
+    graph = random_graph(rng.randint(1, 15), 0.3)
+    expected = CSRGraph.from_matrix(graph, no_edge=float('inf'))
+    edges = edge_list(graph)
+    rng.shuffle(edges)
+
+    for built in (CSRGraph.from_edges(len(graph), edges),
+                  CSRGraph.from_edges(len(graph), np.array(edges, dtype=np.float64).reshape(-1, 3))):
+        assert built.weights.dtype == np.int64
+        for vertex in range(len(graph)):
+            assert list(built.edges(vertex)) == list(expected.edges(vertex))
+
+def test_from_edges_undirected_and_unweighted():
+    graph = CSRGraph.from_edges(3, [(0, 1), (1, 2)], undirected=True)
+    assert [graph.neighbors(v) for v in range(3)] == [[1], [0, 2], [1]]
+    assert list(graph.edges(1)) == [(0, 1), (2, 1)]
+    assert len(CSRGraph.from_edges(4, [])) == 4
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_reverse_flips_every_edge(rng, random_graph):
+    graph = random_graph(rng.randint(1, 15), 0.3)
+    reverse = CSRGraph.from_matrix(graph, no_edge=float('inf')).reverse()
+    transposed = [list(column) for column in zip(*graph)]
+    expected = CSRGraph.from_matrix(transposed, no_edge=float('inf'))
+    for vertex in range(len(graph)):
+        assert list(reverse.edges(vertex)) == list(expected.edges(vertex))
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_search_on_csr_matches_matrix(rng, random_graph):
+    graph = random_graph(rng.randint(2, 15), 0.3)
+    csr = CSRGraph.from_edges(len(graph), edge_list(graph))
+    assert as_graph(csr) is csr
+    zero = [0] * len(graph)
+    for goal in range(len(graph)):
+        assert a_star_search(csr, 0, goal, zero) == a_star_search(graph, 0, goal, zero)
@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from ai_practicals.graph import CSRGraph
+from ai_practicals.idda_star import (FileTraceSink, ida_star_search, ida_star_search_with_stats,
+                                     parallel_ida_star_search)
+from ai_practicals.landmarks import shortest_path_distances
+
+def admissible_heuristic(graph, goal):
+    """Half the true distance to the goal (0 where the goal is unreachable)"""
+    reverse = CSRGraph.from_matrix(graph, no_edge=float('inf')).reverse()
+    to_goal = shortest_path_distances(reverse, goal)
+    return [0 if math.isinf(distance) else int(distance) // 2 for distance in to_goal]
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_ida_star_matches_dijkstra_and_stays_quiet(rng, random_graph, capsys):
+    graph = random_graph(rng.randint(2, 9), rng.choice([0.25, 0.4]), max_cost=9)
+    start, goal = rng.sample(range(len(graph)), 2)
+    expected = shortest_path_distances(graph, start)[goal]
+
+    path, cost, stats = ida_star_search_with_stats(graph, start, goal, admissible_heuristic(graph, goal))
+    if math.isinf(expected):
+        assert path is None
+    else:
+        assert cost == expected
+        assert path[0] == start and path[-1] == goal
+        assert sum(graph[a][b] for a, b in zip(path, path[1:])) == cost
+    assert stats["iterations"] >= 1 and stats["nodes_generated"] >= 1
+    assert capsys.readouterr().out == ""
+
+def test_trace_sinks(tmp_path):
+    graph = [[0, 1, float('inf')], [1, 0, 1], [float('inf'), 1, 0]]
+    events = []
+    assert ida_star_search(graph, 0, 2, [0, 0, 0], trace=events.append) == ([0, 1, 2], 2)
+    assert events[-1] == (2, 2, 2, 2, "GOAL")
+    assert {event[4] for event in events} <= {"EXPLORED", "PRUNED", "GOAL"}
+
+    unused = FileTraceSink(tmp_path / "unused.tsv")
+    unused.close()
+    assert not (tmp_path / "unused.tsv").exists()
+
+    with FileTraceSink(tmp_path / "trace.tsv") as sink:
+        ida_star_search(graph, 0, 2, [0, 0, 0], trace=sink)
+    lines = (tmp_path / "trace.tsv").read_text().splitlines()
+    assert lines[0] == "threshold\tnode\tdepth\tf_cost\tstatus"
+    assert len(lines) == len(events) + 1
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_parallel_matches_sequential(rng, random_graph):
+    graph = random_graph(rng.randint(3, 9), rng.choice([0.25, 0.4]), max_cost=9)
+    start, goal = rng.sample(range(len(graph)), 2)
+    heuristic = admissible_heuristic(graph, goal)
+
+    expected = ida_star_search(graph, start, goal, heuristic)
+    for split_depth in (1, 2, 3):
+        path, cost, _ = parallel_ida_star_search(graph, start, goal, heuristic,
+                                                 workers=2, split_depth=split_depth)
+        assert (path, cost) == expected
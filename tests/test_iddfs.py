@@ -0,0 +1,48 @@
+import pytest
+
+from ai_practicals.bfs import bfs_levels
+from ai_practicals.iddfs import bidirectional_iddfs, depth_limited_dfs, iddfs, iddfs_with_stats
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_iddfs_finds_a_shortest_path(rng, random_graph):
+    graph = random_graph(rng.randint(1, 20), 0.15, max_cost=1, no_edge=0)
+    start, goal = rng.randrange(len(graph)), rng.randrange(len(graph))
+    hops = bfs_levels(graph, start)[0][goal]
+
+    path, nodes_per_depth = iddfs_with_stats(graph, start, goal)
+    if hops == -1:
+        assert path is None
+    else:
+        assert path[0] == start and path[-1] == goal
+        assert len(path) - 1 == hops == len(nodes_per_depth) - 1
+        assert all(graph[a][b] for a, b in zip(path, path[1:]))
+        if hops > 0:
+            assert iddfs_with_stats(graph, start, goal, max_depth=hops - 1)[0] is None
+
+@pytest.mark.parametrize("rng", range(30), indirect=True)
+def test_bidirectional_iddfs_matches_bfs(rng, random_graph):
+    graph = random_graph(rng.randint(1, 25), rng.choice([0.08, 0.15]), max_cost=1, no_edge=0)
+    start, goal = rng.randrange(len(graph)), rng.randrange(len(graph))
+    hops = bfs_levels(graph, start)[0][goal]
+
+    path = bidirectional_iddfs(graph, start, goal)
+    if hops == -1:
+        assert path is None
+    else:
+        assert path[0] == start and path[-1] == goal
+        assert len(path) - 1 == hops
+        assert all(graph[a][b] for a, b in zip(path, path[1:]))
+        if hops > 0:
+            assert bidirectional_iddfs(graph, start, goal, max_depth=hops - 1) is None
+
+def test_depth_limited_dfs_restores_state_on_backtrack():
+    graph = [[0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1], [0, 0, 0, 0]]
+    visited, path = set(), []
+    assert depth_limited_dfs(graph, 0, 3, 2, visited, path) == (False, [])
+    assert visited == set()
+    assert depth_limited_dfs(graph, 0, 3, 3) == (True, [0, 1, 2, 3])
+
+def test_iddfs_prints_nodes_per_depth(capsys):
+    graph = [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    assert iddfs(graph, 0, 2) == [0, 1, 2]
+    assert capsys.readouterr().out.count("--- Searched with depth limit") == 3
@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Budget for `import ai_practicals` in a fresh interpreter, in seconds
+IMPORT_BUDGET = 0.05
+
+SUBMODULES = [
+    "a_star", "bfs", "dfs", "distance_providers", "graph", "idda_star",
+    "iddfs", "landmarks", "min_max", "steepest_hill", "streaming", "tsp_genetic",
+]
+
+def run_python(code):
+    """Run code in a fresh interpreter with the repository on the path, return its stdout"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout
+
+MEASURE_IMPORT = """
+import json, sys, time
+start = time.perf_counter()
+import ai_practicals
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+def test_package_import_is_within_budget():
+    # Best of a few runs, so a busy machine doesn't fail the test by itself
+    runs = [json.loads(run_python(MEASURE_IMPORT)) for _ in range(3)]
+    elapsed = min(run["elapsed"] for run in runs)
+    assert elapsed < IMPORT_BUDGET, f"import ai_practicals took {elapsed * 1000:.1f} ms"
+
+def test_package_import_loads_nothing_else():
+    modules = json.loads(run_python(MEASURE_IMPORT))["modules"]
+    assert "numpy" not in modules
+    assert not [name for name in modules if name.startswith("ai_practicals.")]
+
+@pytest.mark.parametrize("name", SUBMODULES)
+def test_submodule_import_has_no_side_effects(name):
+    # Importing a module must not run its demo
+    assert run_python(f"import ai_practicals.{name}") == ""
+
+def test_submodules_load_on_first_access():
+    output = run_python(
+        "import sys, ai_practicals\n"
+        "print('ai_practicals.bfs' in sys.modules)\n"
+        "print(ai_practicals.bfs.bfs_levels.__name__)\n"
+        "print('ai_practicals.bfs' in sys.modules)\n"
+    )
+    assert output.split() == ["False", "bfs_levels", "True"]
@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from ai_practicals.a_star import a_star_search
+from ai_practicals.graph import CSRGraph
+from ai_practicals.landmarks import LandmarkHeuristic, shortest_path_distances
+
+def distances_to(graph, goal):
+    """True distance from every node to the goal"""
+    return shortest_path_distances(CSRGraph.from_matrix(graph, no_edge=float('inf')).reverse(), goal)
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_shortest_path_distances_match_a_star(rng, random_graph):
+    graph = random_graph(rng.randint(1, 20), 0.2)
+    distances = shortest_path_distances(graph, 0)
+    zero = [0] * len(graph)
+    for goal in range(len(graph)):
+        assert distances[goal] == a_star_search(graph, 0, goal, zero)[1]
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_costs_are_admissible_and_match_for_query(rng, random_graph):
+    graph = random_graph(rng.randint(2, 25), rng.choice([0.1, 0.3]))
+    heuristic = LandmarkHeuristic.build(graph, num_landmarks=3, seed=rng.randrange(100))
+
+    for goal in range(len(graph)):
+        costs = heuristic.costs(goal)
+        true = distances_to(graph, goal)
+        assert np.all(costs <= true)
+        assert costs[goal] == 0
+
+        query = heuristic.for_query(0, goal)
+        assert len(query) == len(graph)
+        assert [query[node] for node in range(len(graph))] == costs.tolist()
+
+        fewer = heuristic.for_query(0, goal, active=1)
+        assert all(fewer[node] <= costs[node] for node in range(len(graph)))
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_a_star_with_alt_heuristic_matches_dijkstra(rng, random_graph):
+    graph = random_graph(20, 0.2)
+    heuristic = LandmarkHeuristic.build(graph, num_landmarks=4, seed=rng.randrange(100))
+    distances = shortest_path_distances(graph, 0)
+    for goal in range(len(graph)):
+        if not math.isinf(distances[goal]):
+            _, cost = a_star_search(graph, 0, goal, heuristic.for_query(0, goal, active=2))
+            assert cost == distances[goal]
+
+def test_save_and_load_round_trip(tmp_path, random_graph):
+    heuristic = LandmarkHeuristic.build(random_graph(15, 0.3), num_landmarks=2, seed=0)
+    heuristic.save(tmp_path / "landmarks.npz")
+    loaded = LandmarkHeuristic.load(tmp_path / "landmarks.npz")
+    assert np.array_equal(loaded.landmarks, heuristic.landmarks)
+    assert np.array_equal(loaded.distances, heuristic.distances)
@@ -0,0 +1,210 @@
+import numpy as np
+import pytest
+
+from ai_practicals.min_max import (AlphaBeta, Game, MatrixGame, TranspositionTable, alpha_beta_search,
+                                   game_minimax, get_children, iterative_deepening_search, minimax,
+                                   parallel_minimax, vectorized_minimax)
+
+def random_tree(rng, height, branching_factor=2):
+    """Complete matrix game tree with random integer leaves"""
+    tree = [[None] * branching_factor ** level for level in range(height)]
+    tree.append([rng.randint(-50, 50) for _ in range(branching_factor ** height)])
+    return tree
+
+class LineGame(Game):
+    """Walk 1 or 2 squares forward; a square can be reached with either side to move"""
+    def __init__(self, payoffs):
+        self.payoffs = payoffs
+
+    def initial_state(self):
+        return 0
+
+    def children(self, state):
+        return (state + step for step in (1, 2))
+
+    def is_terminal(self, state):
+        return state >= len(self.payoffs) - 2
+
+    def evaluate(self, state):
+        return self.payoffs[state]
+
+def evaluate(node):
+    """Arbitrary deterministic heuristic for internal nodes"""
+    return (node[0] * 7 + node[1] * 13) % 11 - 5
+
+def limited_minimax(tree, node, is_maximizing, draft, branching_factor):
+    """Minimax that scores internal nodes with evaluate once draft levels are used up"""
+    if node[0] == len(tree) - 1:
+        return tree[node[0]][node[1]]
+    if draft == 0:
+        return evaluate(node)
+    values = [limited_minimax(tree, child, not is_maximizing, draft - 1, branching_factor)
+              for child in get_children(node, tree, branching_factor)]
+    return max(values) if is_maximizing else min(values)
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_alpha_beta_matches_minimax(rng):
+    branching_factor = rng.randint(2, 3)
+    tree = random_tree(rng, rng.randint(1, 7 if branching_factor == 2 else 4), branching_factor)
+    total_nodes = sum(len(level) for level in tree)
+    noise = {}
+
+    def evaluate(node):
+        # Any evaluation is allowed for ordering, only the value is checked
+        return noise.setdefault(node, rng.random())
+
+    for is_maximizing in (True, False):
+        expected = minimax((0, 0), 0, is_maximizing, tree, branching_factor)
+        for move_ordering in (None, "static", "killer", "history"):
+            for table_size in (None, 3, 1000):
+                value, stats = alpha_beta_search(tree, is_maximizing, move_ordering, evaluate,
+                                                 table_size, branching_factor)
+                assert value == expected
+                assert stats["nodes_evaluated"] <= total_nodes
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_warm_transposition_table_gives_the_same_value(rng):
+    tree = random_tree(rng, rng.randint(2, 7))
+    expected = minimax((0, 0), 0, True, tree)
+    table = TranspositionTable(max_size=1000)
+
+    engine = AlphaBeta(tree, "history", table=table)
+    assert engine.search((0, 0), True) == expected
+    assert engine.search((0, 0), True) == expected
+    assert table.hits > 0
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_vectorized_matches_minimax(rng, tmp_path):
+    branching_factor = rng.randint(2, 4)
+    height = rng.randint(0, 8 if branching_factor == 2 else 4)
+    tree = random_tree(rng, height, branching_factor)
+    np.save(tmp_path / "leaves.npy", np.array(tree[-1]))
+
+    for is_maximizing in (True, False):
+        expected = minimax((0, 0), 0, is_maximizing, tree, branching_factor)
+        for leaves in (tree[-1], tmp_path / "leaves.npy", str(tmp_path / "leaves.npy")):
+            value, best_moves = vectorized_minimax(leaves, branching_factor, is_maximizing=is_maximizing)
+            assert value == expected
+            assert len(best_moves) == height
+
+            # The principal variation ends at a leaf with the root value
+            leaf = 0
+            for move in best_moves:
+                leaf = leaf * branching_factor + move
+            assert tree[-1][leaf] == expected
+
+def test_vectorized_with_num_levels_ignores_unreachable_leaves():
+    leaves = [3, 5, 2, 9, 12, 8]
+    assert vectorized_minimax(leaves, 2, num_levels=2) == (3, [0, 0])
+    assert vectorized_minimax(leaves, 3, num_levels=1, is_maximizing=False) == (2, [2])
+
+@pytest.mark.parametrize("leaves, branching_factor", [([3, 5, 1], 1), ([3, 5, 1], 0), ([3, 5, 1], 2)])
+def test_vectorized_rejects_trees_that_are_not_complete(leaves, branching_factor):
+    with pytest.raises(ValueError):
+        vectorized_minimax(leaves, branching_factor)
+
+@pytest.mark.parametrize("rng", range(15), indirect=True)
+def test_iterative_deepening_matches_minimax_when_it_completes(rng):
+    branching_factor = rng.randint(2, 3)
+    height = rng.randint(1, 6 if branching_factor == 2 else 4)
+    tree = random_tree(rng, height, branching_factor)
+
+    for is_maximizing in (True, False):
+        expected = minimax((0, 0), 0, is_maximizing, tree, branching_factor)
+        for move_ordering in (None, "static", "killer", "history"):
+            move, value, stats = iterative_deepening_search(
+                tree, evaluate, is_maximizing, move_ordering=move_ordering,
+                branching_factor=branching_factor)
+            assert value == expected
+            assert minimax(move, 1, not is_maximizing, tree, branching_factor) == expected
+            assert stats["depth_reached"] == height and not stats["budget_exceeded"]
+
+@pytest.mark.parametrize("rng", range(10), indirect=True)
+def test_iterative_deepening_cutoffs(rng):
+    tree = random_tree(rng, 10)
+    is_maximizing = rng.random() < 0.5
+
+    def expected(depth):
+        children = get_children((0, 0), tree)
+        values = [limited_minimax(tree, child, not is_maximizing, depth - 1, 2) for child in children]
+        return max(values) if is_maximizing else min(values)
+
+    max_depth = rng.randint(1, 9)
+    _, value, stats = iterative_deepening_search(tree, evaluate, is_maximizing, max_depth=max_depth)
+    assert stats["depth_reached"] == max_depth and not stats["budget_exceeded"]
+    assert value == expected(max_depth)
+
+    max_nodes = rng.randint(1, 200)
+    _, value, stats = iterative_deepening_search(tree, evaluate, is_maximizing, max_nodes=max_nodes)
+    assert stats["budget_exceeded"] and stats["nodes_evaluated"] <= max_nodes + 1
+    if stats["depth_reached"]:
+        assert value == expected(stats["depth_reached"])
+
+    _, value, stats = iterative_deepening_search(tree, evaluate, is_maximizing, time_limit=0)
+    assert stats["budget_exceeded"] and stats["depth_reached"] < 10
+    if stats["depth_reached"]:
+        assert value == expected(stats["depth_reached"])
+
+def test_iterative_deepening_on_a_leaf_root():
+    move, value, stats = iterative_deepening_search([[7]], evaluate)
+    assert (move, value, stats["depth_reached"]) == (None, 7, 0)
+
+@pytest.mark.parametrize("rng", range(20), indirect=True)
+def test_game_search_with_table_matches_minimax(rng):
+    tree = random_tree(rng, rng.randint(1, 6))
+    line = LineGame([rng.randint(-9, 9) for _ in range(rng.randint(3, 14))])
+
+    for is_maximizing in (True, False):
+        assert game_minimax(tree, is_maximizing=is_maximizing) == minimax((0, 0), 0, is_maximizing, tree)
+
+    for game in (MatrixGame(tree, heuristic=evaluate), line):
+        for is_maximizing in (True, False):
+            expected = game_minimax(game, is_maximizing=is_maximizing)
+            for move_ordering in (None, "static", "killer", "history"):
+                engine = AlphaBeta(game, move_ordering, table=TranspositionTable())
+                assert engine.search(game.initial_state(), is_maximizing) == expected
+
+def test_game_must_implement_the_protocol():
+    class Unfinished(Game):
+        def initial_state(self):
+            return 0
+
+    with pytest.raises(TypeError):
+        Unfinished()
+
+@pytest.mark.parametrize("rng", range(12), indirect=True)
+def test_parallel_matches_minimax(rng):
+    branching_factor = rng.randint(2, 3)
+    height = rng.randint(1, 4)
+    tree = random_tree(rng, height, branching_factor)
+
+    for is_maximizing in (True, False):
+        expected = minimax((0, 0), 0, is_maximizing, tree, branching_factor)
+        for split_depth in range(1, height + 1):
+            for move_ordering in (None, "killer", "history"):
+                value, _ = parallel_minimax(tree, is_maximizing, branching_factor, split_depth,
+                                            workers=2, move_ordering=move_ordering)
+                assert value == expected
+
+def test_parallel_on_trees_shallower_than_split_depth():
+    assert parallel_minimax([[7]]) == (7, {"nodes_evaluated": 1, "tasks": 0})
+    value, stats = parallel_minimax([[None], [3, 5]], split_depth=2)
+    assert value == 5 and stats["tasks"] == 0
+
+def test_parallel_rejects_non_numeric_leaves():
+    with pytest.raises(ValueError):
+        parallel_minimax([[None], [None, None], [3, 5, None, 9]], workers=1)
+
+def test_table_evicts_least_recently_used():
+    table = TranspositionTable(max_size=2)
+    table.store("a", 1, 0, 0, None)
+    table.store("b", 1, 0, 0, None)
+    table.get("a")
+    table.store("c", 1, 0, 0, None)
+    assert list(table.entries) == ["a", "c"] and table.evictions == 1
+
+def test_unknown_move_ordering_is_rejected():
+    with pytest.raises(ValueError):
+        AlphaBeta([[None], [1, 2]], "random")
+    with pytest.raises(ValueError):
+        AlphaBeta([[None], [1, 2]], "static")
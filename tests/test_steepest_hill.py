@@ -0,0 +1,131 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from ai_practicals.steepest_hill import (calculate_total_distance, generate_neighbors, hill_climbing_stream,
+                                         local_search, nearest_neighbors, random_restart_hill_climbing,
+                                         steepest_hill_climbing, swap_climb, swap_deltas)
+
+def random_route(np_rng, num_cities):
+    return [0] + (np_rng.permutation(num_cities - 1) + 1).tolist() + [0]
+
+@pytest.mark.parametrize("np_rng", range(20), indirect=True)
+def test_swap_deltas_match_neighbor_distances(np_rng, random_instance):
+    num_cities = int(np_rng.integers(2, 12))
+    if np_rng.random() < 0.5:
+        distances = np_rng.integers(1, 100, size=(num_cities, num_cities))  # asymmetric
+    else:
+        distances = random_instance(num_cities)
+    route = random_route(np_rng, num_cities)
+    current = calculate_total_distance(route, distances)
+
+    deltas = swap_deltas(route, distances)
+    expected = np.full((num_cities - 1, num_cities - 1), np.inf)
+    neighbors = iter(generate_neighbors(route))
+    for i in range(num_cities - 1):
+        for j in range(i + 1, num_cities - 1):
+            expected[i, j] = calculate_total_distance(next(neighbors), distances) - current
+    np.testing.assert_allclose(deltas, expected)
+
+@pytest.mark.parametrize("np_rng", range(5), indirect=True)
+def test_climb_ends_in_a_swap_local_optimum(np_rng, random_instance, assert_valid_tour, capsys):
+    random.seed(int(np_rng.integers(2 ** 32)))
+    distances = random_instance(12, integer=True)
+
+    route, distance = steepest_hill_climbing(distances, max_iterations=1000, verbose=True)
+    assert_valid_tour(route, 12)
+    assert distance == calculate_total_distance(route, distances)
+    assert swap_deltas(route, distances).min() >= 0
+    assert "Local optimum reached" in capsys.readouterr().out
+
+@pytest.mark.parametrize("np_rng", range(20), indirect=True)
+@pytest.mark.parametrize("moves", [("2-opt",), ("or-opt",), ("2-opt", "or-opt")])
+def test_local_search_returns_valid_improved_tour(np_rng, moves, random_instance, assert_valid_tour):
+    num_cities = int(np_rng.integers(2, 60))
+    distances = random_instance(num_cities, integer=np_rng.random() < 0.5)
+    route = random_route(np_rng, num_cities)
+    initial = calculate_total_distance(route, distances)
+
+    new_route, distance, stats = local_search(distances, route, moves=moves,
+                                              k=int(np_rng.integers(1, 10)),
+                                              max_segment=int(np_rng.integers(1, 4)))
+
+    assert_valid_tour(new_route, num_cities)
+    assert distance == pytest.approx(calculate_total_distance(new_route, distances))
+    assert distance <= initial + 1e-9
+    assert stats["improvement"] == pytest.approx(initial - distance)
+
+@pytest.mark.parametrize("np_rng", range(5), indirect=True)
+def test_nearest_neighbors_are_sorted_and_exclude_self(np_rng, random_instance):
+    distances = random_instance(30)
+    candidates = nearest_neighbors(distances, k=5, chunk_size=7)
+
+    for city, row in enumerate(candidates):
+        others = sorted((distances[city, other], other) for other in range(30) if other != city)
+        np.testing.assert_allclose(distances[city, row], [d for d, _ in others[:5]])
+        assert city not in row
+
+@pytest.mark.parametrize("neighborhood", ["swap", "2-opt+or-opt"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_best_of_restarts_is_no_worse_than_one_climb(seed, neighborhood, random_instance, assert_valid_tour):
+    distances = random_instance(25)
+
+    single_route, single, _ = random_restart_hill_climbing(
+        distances, restarts=1, workers=1, seed=seed, neighborhood=neighborhood)
+    best_route, best, stats = random_restart_hill_climbing(
+        distances, restarts=6, workers=2, seed=seed, neighborhood=neighborhood)
+
+    # Restart 0 uses the same child seed in both runs
+    assert stats["distances"][0] == pytest.approx(single)
+    assert best <= single and best == pytest.approx(stats["distances"].min())
+    assert best == pytest.approx(calculate_total_distance(best_route, distances))
+    assert_valid_tour(single_route, 25)
+    assert_valid_tour(best_route, 25)
+
+def test_swap_climb_stops_at_the_time_limit(random_instance, assert_valid_tour):
+    distances = random_instance(300)
+    route = list(range(300)) + [0]
+
+    start = time.perf_counter()
+    new_route, distance, iterations, improved = swap_climb(distances, route, max_iterations=10 ** 6,
+                                                           time_limit=0.2)
+    assert time.perf_counter() - start < 1.0
+    assert improved and 0 < iterations < 10 ** 6
+    assert distance == pytest.approx(calculate_total_distance(new_route, distances))
+    assert_valid_tour(new_route, 300)
+
+def test_random_restarts_respect_the_time_limit(random_instance, assert_valid_tour):
+    distances = random_instance(300)
+
+    best_route, best, stats = random_restart_hill_climbing(
+        distances, restarts=50, workers=2, seed=0, neighborhood="swap",
+        max_iterations=10 ** 6, time_limit=0.3)
+    assert stats["elapsed"] < 2.0 and stats["restarts"] < 50
+    assert_valid_tour(best_route, 300)
+
+def test_local_search_stream_stops_at_target(np_rng, random_instance):
+    distances = random_instance(300)
+    route = random_route(np_rng, 300)
+    records = list(hill_climbing_stream(distances, neighborhood="2-opt+or-opt", route=route))
+    assert len(records) > 3 and records[-1]["local_optimum"]
+    assert records[-1]["best_distance"] == pytest.approx(local_search(distances, route)[1])
+
+    target = records[2]["best_distance"]
+    stopped = list(hill_climbing_stream(distances, neighborhood="2-opt+or-opt", route=route,
+                                        target=target))
+    assert len(stopped) == 3 and not stopped[-1]["local_optimum"]
+
+@pytest.mark.parametrize("np_rng", range(3), indirect=True)
+def test_swap_stream_records_match_the_climb(np_rng, random_instance):
+    distances = random_instance(15)
+    route = random_route(np_rng, 15)
+    records = list(hill_climbing_stream(distances, max_iterations=1000, route=route))
+
+    assert records[0]["iteration"] == 0 and records[0]["route"] == route
+    final_route, final_distance, iterations, _ = swap_climb(distances, route, max_iterations=1000)
+    assert (records[-1]["route"], records[-1]["iteration"]) == (final_route, iterations)
+    assert records[-1]["best_distance"] == pytest.approx(final_distance)
+    assert all(later["best_distance"] <= earlier["best_distance"]
+               for earlier, later in zip(records, records[1:]))
@@ -0,0 +1,53 @@
+import pytest
+
+from ai_practicals.streaming import stop_early
+
+def records(distances, elapsed=None):
+    """Generator of stats records that notes whether it was closed"""
+    state = {"closed": False, "produced": 0}
+
+    def stream():
+        try:
+            for index, distance in enumerate(distances):
+                state["produced"] += 1
+                yield {"best_distance": distance,
+                       "elapsed": index if elapsed is None else elapsed[index]}
+        finally:
+            state["closed"] = True
+
+    return stream(), state
+
+def best_distances(stream):
+    return [stats["best_distance"] for stats in stream]
+
+def test_without_criteria_every_record_passes_through():
+    stream, state = records([5, 4, 4, 3])
+    assert best_distances(stop_early(stream)) == [5, 4, 4, 3]
+    assert state["closed"]
+
+@pytest.mark.parametrize("target, expected", [(4, [9, 7, 4]), (5, [9, 7, 4]), (9, [9]), (0, [9, 7, 4, 4, 2])])
+def test_target_stops_at_the_record_that_reaches_it(target, expected):
+    stream, state = records([9, 7, 4, 4, 2])
+    assert best_distances(stop_early(stream, target=target)) == expected
+    assert state["closed"] and state["produced"] == len(expected)
+
+def test_time_limit_uses_the_records_elapsed():
+    stream, state = records([9, 8, 7, 6], elapsed=[0.1, 0.5, 1.0, 1.5])
+    assert best_distances(stop_early(stream, time_limit=1.0)) == [9, 8, 7]
+    assert state["produced"] == 3
+
+@pytest.mark.parametrize("stagnation, expected", [
+    (1, [9, 7, 7]),
+    (2, [9, 7, 7, 6, 6, 6]),
+    (3, [9, 7, 7, 6, 6, 6, 6]),
+])
+def test_stagnation_counts_records_without_a_better_distance(stagnation, expected):
+    stream, _ = records([9, 7, 7, 6, 6, 6, 6, 5])
+    assert best_distances(stop_early(stream, stagnation=stagnation)) == expected
+
+def test_stopping_from_outside_closes_the_stream():
+    stream, state = records(range(100, 0, -1))
+    stopped = stop_early(stream, target=0)
+    next(stopped)
+    stopped.close()
+    assert state["closed"] and state["produced"] == 1
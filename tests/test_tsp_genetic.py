@@ -0,0 +1,217 @@
+import random
+
+import numpy as np
+import pytest
+
+from ai_practicals.tsp_genetic import (FitnessCache, _migrate, batch_crossover, batch_mutate,
+                                       batch_tournament_selection, calculate_fitness, canonical_tours,
+                                       crossover, genetic_algorithm, genetic_algorithm_stream,
+                                       initialize_population, island_genetic_algorithm, population_distances,
+                                       population_diversity)
+
+@pytest.mark.parametrize("np_rng", range(10), indirect=True)
+def test_population_distances_match_calculate_fitness(np_rng, random_instance, assert_valid_tour):
+    random.seed(int(np_rng.integers(2 ** 32)))
+    num_cities = int(np_rng.integers(2, 30))
+    distances = random_instance(num_cities, integer=np_rng.random() < 0.5)
+    population = initialize_population(int(np_rng.integers(1, 20)), num_cities)
+
+    assert population.dtype == np.int64 and population.shape[1] == num_cities + 1
+    for route in population:
+        assert_valid_tour(route, num_cities)
+
+    route_distances = population_distances(population, distances)
+    for route, distance in zip(population, route_distances):
+        assert calculate_fitness(route, distances) == pytest.approx(1 / distance)
+
+@pytest.mark.parametrize("np_rng", range(3), indirect=True)
+def test_genetic_algorithm_returns_a_valid_tour(np_rng, random_instance, assert_valid_tour, capsys):
+    random.seed(int(np_rng.integers(2 ** 32)))
+    distances = random_instance(12, integer=True)
+
+    best_route, best_distance = genetic_algorithm(distances, pop_size=20, generations=15, verbose=True)
+    assert_valid_tour(best_route, 12)
+    assert best_distance == population_distances([best_route], distances)[0]
+    assert "New best route" in capsys.readouterr().out
+
+def test_calculate_fitness_of_a_zero_length_route_is_infinite():
+    assert calculate_fitness([0, 1, 0], np.zeros((2, 2))) == float('inf')
+
+@pytest.mark.parametrize("np_rng", range(10), indirect=True)
+def test_crossover_children_are_permutations(np_rng, assert_valid_tour):
+    random.seed(int(np_rng.integers(2 ** 32)))
+    num_cities = int(np_rng.integers(3, 30))
+    parents = initialize_population(40, num_cities, np_rng)
+
+    for parent1, parent2 in zip(parents[::2].tolist(), parents[1::2].tolist()):
+        assert_valid_tour(crossover(parent1, parent2), num_cities)
+
+    children = batch_crossover(parents[::2], parents[1::2], np_rng)
+    for child, parent1 in zip(children, parents[::2]):
+        assert_valid_tour(child, num_cities)
+        # OX keeps a segment of at least one city of parent1 in place
+        same = np.flatnonzero(child[1:-1] == parent1[1:-1])
+        assert len(same) >= 1
+
+@pytest.mark.parametrize("np_rng", range(10), indirect=True)
+@pytest.mark.parametrize("kind", ["swap", "inversion"])
+def test_batch_mutate_keeps_permutations(np_rng, kind, assert_valid_tour):
+    num_cities = int(np_rng.integers(2, 30))
+    population = initialize_population(30, num_cities, np_rng)
+    original = population.copy()
+
+    mutated = batch_mutate(population, 0.5, np_rng, kind)
+    assert mutated is population
+    for route in mutated:
+        assert_valid_tour(route, num_cities)
+
+    assert (batch_mutate(original.copy(), 0, np_rng, kind) == original).all()
+
+def test_unknown_mutation_kind_is_rejected():
+    with pytest.raises(ValueError):
+        batch_mutate(np.tile(np.arange(6), (4, 1)), 1, np.random.default_rng(0), "scramble")
+
+@pytest.mark.parametrize("np_rng", range(5), indirect=True)
+def test_batch_tournament_selection(np_rng):
+    fitness_values = np_rng.random(10)
+    winners = batch_tournament_selection(fitness_values, 200, np_rng)
+    assert winners.shape == (200,) and ((winners >= 0) & (winners < 10)).all()
+    # The two weakest individuals can never beat two other distinct contestants
+    assert not np.isin(winners, np.argsort(fitness_values)[:2]).any()
+
+    # With everyone in the tournament the best always wins
+    assert (batch_tournament_selection(fitness_values, 20, np_rng, tournament_size=10)
+            == np.argmax(fitness_values)).all()
+
+def test_genetic_algorithm_is_reproducible_from_seed(random_instance):
+    distances = random_instance(15)
+    for mutation in ("swap", "inversion"):
+        first = genetic_algorithm(distances, pop_size=20, generations=20, seed=7, mutation=mutation)
+        assert genetic_algorithm(distances, pop_size=20, generations=20, seed=7, mutation=mutation) == first
+
+@pytest.mark.parametrize("np_rng", range(10), indirect=True)
+@pytest.mark.parametrize("topology", ["ring", "random"])
+def test_migration_keeps_valid_permutations(np_rng, topology, random_instance, assert_valid_tour):
+    num_cities = int(np_rng.integers(3, 20))
+    distances = random_instance(num_cities)
+    populations = [initialize_population(10, num_cities, np_rng) for _ in range(int(np_rng.integers(2, 5)))]
+    best = [population[np.argmin(population_distances(population, distances))].copy()
+            for population in populations]
+
+    _migrate(populations, distances, 3, topology, np_rng)
+
+    for population in populations:
+        assert population.shape == (10, num_cities + 1)
+        for route in population:
+            assert_valid_tour(route, num_cities)
+    # Every island's best route now also lives on some other island
+    for island, route in enumerate(best):
+        assert any((population == route).all(axis=1).any()
+                   for other, population in enumerate(populations) if other != island)
+
+def test_unknown_topology_is_rejected():
+    populations = [initialize_population(4, 5, np.random.default_rng(0)) for _ in range(2)]
+    with pytest.raises(ValueError):
+        _migrate(populations, np.ones((5, 5)), 1, "star", np.random.default_rng(0))
+
+def test_island_model_is_reproducible_from_seed(random_instance, assert_valid_tour):
+    distances = random_instance(15)
+    runs = [island_genetic_algorithm(distances, islands=3, pop_size=12, generations=12, migration_interval=5,
+                                     topology=topology, seed=3, workers=workers)
+            for topology, workers in [("random", 1), ("random", 3), ("ring", 2)]]
+
+    (route, distance, stats), (same_route, same_distance, same_stats), _ = runs
+    assert (same_route, same_distance) == (route, distance)
+    assert (same_stats["curves"] == stats["curves"]).all()
+
+    for route, distance, stats in runs:
+        assert_valid_tour(route, 15)
+        assert distance == pytest.approx(population_distances([route], distances)[0])
+        assert stats["curves"].shape == (3, 12)
+        assert (np.diff(stats["curves"], axis=1) <= 0).all()
+        assert stats["curves"][:, -1].min() == distance
+
+def test_genetic_algorithm_stream_matches_the_run(random_instance):
+    distances = random_instance(12)
+    records = list(genetic_algorithm_stream(distances, pop_size=20, generations=15, seed=5))
+    assert [stats["generation"] for stats in records] == list(range(15))
+    assert all("diversity" not in stats for stats in records)
+    assert (records[-1]["best_route"], records[-1]["best_distance"]) == genetic_algorithm(
+        distances, pop_size=20, generations=15, seed=5)
+
+    tracked = list(genetic_algorithm_stream(distances, pop_size=20, generations=3, seed=5, track_diversity=True))
+    assert all(0 < stats["diversity"] <= 1 for stats in tracked)
+    assert population_diversity(np.array([[0, 1, 2, 0], [0, 1, 2, 0], [0, 2, 1, 0]])) == pytest.approx(2 / 3)
+
+def test_genetic_algorithm_stops_at_stagnation(random_instance):
+    records = list(genetic_algorithm_stream(random_instance(8), pop_size=10, seed=0, stagnation=5))
+    assert len(records) >= 6
+    assert all(stats["best_distance"] == records[-1]["best_distance"] for stats in records[-6:])
+
+def test_canonical_tours_merge_rotations_and_reversals():
+    routes = np.array([[0, 2, 1, 3, 0], [1, 3, 0, 2, 1], [0, 3, 1, 2, 0]])
+    assert (canonical_tours(routes) == [0, 2, 1, 3]).all()
+    assert (canonical_tours(routes, symmetric=False)[:2] == [0, 2, 1, 3]).all()
+    assert (canonical_tours(routes, symmetric=False)[2] == [0, 3, 1, 2]).all()
+
+def rotations_and_reversals(route):
+    cycle = list(route[:-1])
+    variants = []
+    for shift in range(len(cycle)):
+        for tour in (cycle[shift:] + cycle[:shift], (cycle[shift:] + cycle[:shift])[::-1]):
+            variants.append(tour + tour[:1])
+    return np.array(variants)
+
+@pytest.mark.parametrize("np_rng", range(10), indirect=True)
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_cached_distances_match_calculate_fitness(np_rng, symmetric, random_instance):
+    num_cities = int(np_rng.integers(3, 12))
+    distances = random_instance(num_cities) if symmetric else np_rng.integers(1, 100, (num_cities, num_cities))
+    cache = FitnessCache(distances)
+    assert cache.symmetric == symmetric
+
+    for route in initialize_population(5, num_cities, np_rng):
+        variants = rotations_and_reversals(route)
+        for _ in range(2):
+            # Cold lookups, then warm ones
+            for variant, distance in zip(variants, cache.population_distances(variants)):
+                assert 1 / distance == pytest.approx(calculate_fitness(variant, distances))
+
+    # Only rotations share an entry for asymmetric distances
+    assert len(cache) <= 5 * (1 if symmetric else 2)
+    assert cache.hits > 0
+
+def test_cache_eviction_respects_max_size(random_instance):
+    distances = random_instance(8)
+    cache = FitnessCache(distances, max_size=3)
+    population = initialize_population(40, 8, np.random.default_rng(0))
+    distinct = len(np.unique(canonical_tours(population), axis=0))
+
+    for row in range(0, 40, 4):
+        np.testing.assert_allclose(cache.population_distances(population[row:row + 4]),
+                                   population_distances(population[row:row + 4], distances))
+        assert len(cache) <= 3
+    assert cache.evictions == distinct - len(cache)
+
+    # The most recently used entry is kept, the oldest is gone
+    misses = cache.misses
+    cache.population_distances(population[-1:])
+    assert cache.misses == misses
+    cache.population_distances(population[:1])
+    assert cache.misses == misses + 1
+
+def test_cache_without_distances_uses_the_distance_function():
+    with pytest.raises(ValueError):
+        FitnessCache()
+
+    cache = FitnessCache(distance_function=lambda routes: routes.sum(axis=1))
+    assert not cache.symmetric
+    assert cache.population_distances([[0, 2, 1, 0], [0, 2, 1, 0]]).tolist() == [3, 3]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_genetic_algorithm_with_cache_matches_without(random_instance):
+    distances = random_instance(10)
+    cache = FitnessCache(distances)
+    expected = genetic_algorithm(distances, pop_size=20, generations=10, seed=1)
+    assert genetic_algorithm(distances, pop_size=20, generations=10, seed=1, cache=cache) == expected
+    assert cache.hit_rate > 0